@@ -4,11 +4,85 @@
 # Event representation with vector clocks for distributed system causality tracking
 
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Dict, FrozenSet, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, FrozenSet, Optional, Sequence, Tuple
 
+# Width of one timestamp lane in a packed vector clock. The top bit of every
+# lane is a guard bit, so packed timestamps must stay below 2**31.
+_LANE_BITS = 32
+_LANE_GUARD = 1 << (_LANE_BITS - 1)
 
-@dataclass(frozen=True)
+# Bit assigned to each proposition name, in order of first sighting. Unlike
+# the caches below this table is never trimmed: masks cached on events and
+# compiled formulas rely on a name keeping its bit, and the table only grows
+# with the number of distinct proposition names, not with trace length.
+_PROP_BITS: Dict[str, int] = {}
+
+# Bounds on the caches that share derived values between equal inputs
+_PROP_SET_CACHE_SIZE = 4096
+_INTERN_CACHE_SIZE = 4096
+_LAYOUT_CACHE_SIZE = 256
+
+
+def prop_bit(prop_name: str) -> int:
+    """Return the single-bit mask representing a proposition.
+
+    Proposition names are interned into a process-wide table the first time
+    they are seen, so sets of propositions can be represented as integers and
+    combined or tested with single bitwise operations.
+
+    Args:
+        prop_name: Name of the proposition
+
+    Returns:
+        Integer with exactly one bit set, stable for the lifetime of the process
+    """
+    bit = _PROP_BITS.get(prop_name)
+    if bit is None:
+        bit = 1 << len(_PROP_BITS)
+        _PROP_BITS[prop_name] = bit
+    return bit
+
+
+@lru_cache(maxsize=_PROP_SET_CACHE_SIZE)
+def _prop_set_mask(props: FrozenSet[str]) -> int:
+    """Return the bitmask of a set of propositions, reusing earlier results.
+
+    Args:
+        props: Proposition names
+
+    Returns:
+        OR of the ``prop_bit`` of every proposition in the set
+    """
+    mask = 0
+    for prop_name in props:
+        mask |= prop_bit(prop_name)
+    return mask
+
+
+@lru_cache(maxsize=_LAYOUT_CACHE_SIZE)
+def _layout(procs: Tuple[str, ...]) -> Tuple[Tuple[str, ...], int]:
+    """Return the canonical process layout and its lane guard mask.
+
+    While a layout is cached, clocks over the same processes share one
+    layout tuple, so layouts can be compared by identity. A layout evicted
+    from the cache is rebuilt as a new tuple; comparisons between clocks
+    holding different tuple objects take the general path.
+
+    Args:
+        procs: Process identifiers in clock order
+
+    Returns:
+        Tuple of (shared process tuple, guard-bit mask)
+    """
+    guard = 0
+    for lane in range(len(procs)):
+        guard |= _LANE_GUARD << (lane * _LANE_BITS)
+    return procs, guard
+
+
+@dataclass(frozen=True, slots=True)
 class VectorClock:
     """Vector clock implementation for tracking causal ordering in distributed systems.
 
@@ -20,11 +94,21 @@ class VectorClock:
     access for convenience. Supports standard vector clock operations including
     happens-before comparison and partial ordering.
 
+    Instances use slots rather than a per-instance dictionary; the derived
+    lookup table and packed lanes are cached in slots of their own, which take
+    no part in equality or hashing.
+
     Attributes:
         clock: Tuple of (process_id, timestamp) pairs sorted by process_id
     """
 
     clock: Tuple[Tuple[str, int], ...]
+    _timestamps: Optional[Dict[str, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _lanes: Optional[Tuple[Tuple[str, ...], int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __init__(self, clock_dict: Dict[str, int]) -> None:
         """Initialize vector clock from process-timestamp mapping.
@@ -34,6 +118,119 @@ class VectorClock:
         """
         sorted_items = tuple(sorted(clock_dict.items()))
         object.__setattr__(self, "clock", sorted_items)
+        object.__setattr__(self, "_timestamps", None)
+        object.__setattr__(self, "_lanes", None)
+
+    @classmethod
+    def _from_sorted(cls, items: Tuple[Tuple[str, int], ...]) -> VectorClock:
+        """Build a vector clock from entries already sorted by process.
+
+        Args:
+            items: (process_id, timestamp) pairs in process order
+
+        Returns:
+            Vector clock over the given entries
+        """
+        vc = object.__new__(cls)
+        object.__setattr__(vc, "clock", items)
+        object.__setattr__(vc, "_timestamps", None)
+        object.__setattr__(vc, "_lanes", None)
+        return vc
+
+    @classmethod
+    def intern(cls, clock_dict: Dict[str, int]) -> VectorClock:
+        """Return the shared vector clock for a process-timestamp mapping.
+
+        Vector clocks are immutable, so callers that build the same clock many
+        times can share one instance, together with its cached lookup table
+        and packed lanes. Shared clocks also compare by identity first.
+
+        Args:
+            clock_dict: Dictionary mapping process identifiers to timestamps
+
+        Returns:
+            Vector clock equal to ``VectorClock(clock_dict)``, the same object
+            for every equal mapping while it stays in the bounded intern cache
+        """
+        return _interned_clock(frozenset(clock_dict.items()))
+
+    @classmethod
+    def from_row(cls, values: Sequence[int], processes: Sequence[str]) -> VectorClock:
+        """Build a vector clock from positional timestamps.
+
+        Lets callers describe many clocks as rows of a table sharing one process
+        order, instead of spelling out a dictionary for every event.
+
+        Args:
+            values: Timestamps aligned with ``processes``
+            processes: Process identifiers giving the meaning of each position
+
+        Returns:
+            Vector clock mapping each process to its timestamp
+
+        Raises:
+            ValueError: If ``values`` and ``processes`` differ in length
+        """
+        if len(values) != len(processes):
+            raise ValueError(f"Expected {len(processes)} timestamps, got {len(values)}")
+        return cls(dict(zip(processes, (int(v) for v in values))))
+
+    @classmethod
+    def from_delta(cls, parent: VectorClock, delta: Dict[str, int]) -> VectorClock:
+        """Build a vector clock by overriding some entries of a parent clock.
+
+        Successive events on one process usually differ from their predecessor in
+        a single component, so traces can describe each clock as the changed
+        entries only. The result is fully materialised, keeping comparisons
+        independent of the length of the delta chain.
+
+        Args:
+            parent: Clock of the preceding event
+            delta: Process identifiers mapped to their new timestamps
+
+        Returns:
+            Vector clock equal to ``parent`` with ``delta`` applied
+        """
+        if not delta:
+            return parent
+
+        clock = dict(parent.clock)
+        clock.update(delta)
+        return cls(clock)
+
+    @classmethod
+    def join(cls, clocks: Sequence[VectorClock]) -> VectorClock:
+        """Compute the least upper bound (component-wise maximum) of clocks.
+
+        Processes missing from a clock count as timestamp 0, so the result has
+        an entry for every process of any input clock and no entry below 0.
+        When all clocks share one process layout, the maximum is taken column
+        by column over their timestamps without any dictionary bookkeeping.
+
+        Args:
+            clocks: Vector clocks to combine
+
+        Returns:
+            Smallest vector clock that is ≥ every input clock
+        """
+        if not clocks:
+            return cls({})
+
+        layout = clocks[0]._packed_lanes()[0]
+        if all(vc._packed_lanes()[0] is layout for vc in clocks):
+            columns = zip(*[[timestamp for _, timestamp in vc.clock] for vc in clocks])
+            return cls._from_sorted(
+                tuple(zip(layout, (max(0, *col) for col in columns)))
+            )
+
+        clock: Dict[str, int] = {}
+        for vc in clocks:
+            for proc, timestamp in vc.clock:
+                if timestamp > clock.get(proc, 0):
+                    clock[proc] = timestamp
+                elif proc not in clock:
+                    clock[proc] = 0
+        return cls(clock)
 
     @property
     def clock_dict(self) -> Dict[str, int]:
@@ -44,26 +241,97 @@ class VectorClock:
         """
         return dict(self.clock)
 
+    def timestamp(self, proc: str) -> int:
+        """Look up the timestamp recorded for a single process.
+
+        Unlike ``clock_dict``, no dictionary is built per call: the lookup table
+        is created on first use and cached, which keeps per-process queries in
+        the monitor's delivery and frontier code allocation-free.
+
+        Args:
+            proc: Process identifier to look up
+
+        Returns:
+            Timestamp for the process, or 0 if the clock has no entry for it
+        """
+        timestamps = self._timestamps
+        if timestamps is None:
+            timestamps = dict(self.clock)
+            object.__setattr__(self, "_timestamps", timestamps)
+        return timestamps.get(proc, 0)
+
     def __le__(self, other: VectorClock) -> bool:
         """Determine if this vector clock happened-before or is concurrent with another.
 
         Implements the standard vector clock comparison: self ≤ other if and only if
         for all processes p, self[p] ≤ other[p].
 
+        Both clocks keep their entries sorted by process identifier, so the
+        comparison is a single merge walk over the two tuples; processes missing
+        from the other clock are treated as timestamp 0.
+
         Args:
             other: Vector clock to compare against
 
         Returns:
             True if self happened-before or concurrent with other
         """
-        self_dict = self.clock_dict
-        other_dict = other.clock_dict
-
-        for proc, timestamp in self_dict.items():
-            if timestamp > other_dict.get(proc, 0):
+        if self is other:
+            return True
+
+        procs, packed, guard = self._packed_lanes()
+        other_procs, other_packed, _ = other._packed_lanes()
+        if packed >= 0 and other_packed >= 0 and procs is other_procs:
+            # SWAR: each lane of (other | guard) - self keeps its guard bit set
+            # exactly when other's timestamp is at least self's
+            return ((other_packed | guard) - packed) & guard == guard
+
+        other_clock = other.clock
+        other_len = len(other_clock)
+        j = 0
+
+        for proc, timestamp in self.clock:
+            while j < other_len and other_clock[j][0] < proc:
+                j += 1
+            if j < other_len and other_clock[j][0] == proc:
+                if timestamp > other_clock[j][1]:
+                    return False
+            elif timestamp > 0:
                 return False
         return True
 
+    def _packed_lanes(self) -> Tuple[Tuple[str, ...], int, int]:
+        """Return this clock's process layout packed into one integer.
+
+        Each timestamp occupies a fixed-width lane in process order, which lets
+        clocks over the same processes be compared with a few integer
+        operations. The result is computed on first use and cached.
+
+        The process tuple is canonical: clocks over the same processes return
+        the very same tuple object while its layout is cached, and its guard
+        mask is computed once per layout rather than once per clock.
+
+        Returns:
+            Tuple of (process ids, packed timestamps, guard-bit mask); the packed
+            value is -1 when some timestamp does not fit in a lane
+        """
+        lanes = self._lanes
+        if lanes is not None:
+            return lanes
+
+        procs, guard = _layout(tuple(proc for proc, _ in self.clock))
+
+        packed = 0
+        for lane, (_, timestamp) in enumerate(self.clock):
+            if not 0 <= timestamp < _LANE_GUARD:
+                packed = -1
+                break
+            packed |= timestamp << (lane * _LANE_BITS)
+
+        lanes = (procs, packed, guard)
+        object.__setattr__(self, "_lanes", lanes)
+        return lanes
+
     def __lt__(self, other: VectorClock) -> bool:
         """Determine if this vector clock strictly happened-before another.
 
@@ -73,8 +341,37 @@ class VectorClock:
         Returns:
             True if self strictly happened-before other
         """
+        if self is other:
+            return False
+
+        procs, packed, guard = self._packed_lanes()
+        other_procs, other_packed, _ = other._packed_lanes()
+        if packed >= 0 and other_packed >= 0 and procs is other_procs:
+            return (
+                packed != other_packed
+                and ((other_packed | guard) - packed) & guard == guard
+            )
+
         return self <= other and self.clock != other.clock
 
+    def __eq__(self, other: object) -> bool:
+        """Check whether two vector clocks record the same timestamps.
+
+        Clocks shared through ``intern`` are the same object, so equality is
+        decided by identity before any entries are compared.
+
+        Args:
+            other: Object to compare against
+
+        Returns:
+            True if both clocks hold the same (process, timestamp) entries
+        """
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.clock == other.clock
+
     def __str__(self) -> str:
         """Generate string representation of vector clock.
 
@@ -84,7 +381,20 @@ class VectorClock:
         return f"[{', '.join(f'{p}:{t}' for p, t in self.clock)}]"
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=_INTERN_CACHE_SIZE)
+def _interned_clock(entries: FrozenSet[Tuple[str, int]]) -> VectorClock:
+    """Return the shared vector clock for a set of clock entries.
+
+    Args:
+        entries: (process_id, timestamp) pairs of the clock
+
+    Returns:
+        Vector clock over the entries, the same object while it stays cached
+    """
+    return VectorClock(dict(entries))
+
+
+@dataclass(frozen=True, slots=True)
 class Event:
     """Represents a single event in a distributed system execution.
 
@@ -96,6 +406,9 @@ class Event:
     Events support causal ordering through vector clock comparison,
     enabling proper sequencing in distributed runtime verification.
 
+    Like vector clocks, events use slots; the proposition mask and the hash
+    are cached in slots that take no part in equality, hashing or pickling.
+
     Attributes:
         eid: Unique identifier for this event
         processes: Set of process identifiers involved in this event
@@ -107,6 +420,84 @@ class Event:
     processes: FrozenSet[str]
     vc: VectorClock
     props: FrozenSet[str]
+    _props_mask: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+    def __hash__(self) -> int:
+        """Hash the event's fields, computing the hash once.
+
+        Frontiers hash their events every time they enter a set or a cache,
+        so the hash over the identifier, process set, clock and propositions
+        is kept after the first call.
+
+        Returns:
+            Hash consistent with the field-wise equality
+        """
+        result = self._hash
+        if result is None:
+            result = hash((self.eid, self.processes, self.vc, self.props))
+            object.__setattr__(self, "_hash", result)
+        return result
+
+    def __eq__(self, other: object) -> bool:
+        """Check whether two events have the same fields.
+
+        Objects of other types are rejected before any field is read, and
+        events whose hashes have both been computed and differ are rejected
+        with a single integer comparison.
+
+        Args:
+            other: Object to compare against
+
+        Returns:
+            True if identifier, processes, clock and propositions all match
+        """
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        if (
+            self._hash is not None
+            and other._hash is not None
+            and self._hash != other._hash
+        ):
+            return False
+        return (self.eid, self.processes, self.vc, self.props) == (
+            other.eid,
+            other.processes,
+            other.vc,
+            other.props,
+        )
+
+    def __getstate__(self) -> Tuple[str, FrozenSet[str], VectorClock, FrozenSet[str]]:
+        """Return the state to pickle, without the cached mask and hash.
+
+        Proposition bits are numbered per process and string hashes are
+        salted per process, so both cached values would be wrong in the
+        process that unpickles the event.
+
+        Returns:
+            Tuple of (eid, processes, vc, props)
+        """
+        return (self.eid, self.processes, self.vc, self.props)
+
+    def __setstate__(
+        self, state: Tuple[str, FrozenSet[str], VectorClock, FrozenSet[str]]
+    ) -> None:
+        """Restore a pickled event with empty caches.
+
+        Args:
+            state: Tuple of (eid, processes, vc, props) from ``__getstate__``
+        """
+        eid, processes, vc, props = state
+        object.__setattr__(self, "eid", eid)
+        object.__setattr__(self, "processes", processes)
+        object.__setattr__(self, "vc", vc)
+        object.__setattr__(self, "props", props)
+        object.__setattr__(self, "_props_mask", None)
+        object.__setattr__(self, "_hash", None)
 
     def has_prop(self, prop_name: str) -> bool:
         """Check if a specific proposition holds for this event.
@@ -119,6 +510,25 @@ class Event:
         """
         return prop_name in self.props
 
+    @property
+    def props_mask(self) -> int:
+        """Bitmask of this event's propositions, as assigned by ``prop_bit``.
+
+        Computed on first access and cached on the event. Events with equal
+        proposition sets, such as those sharing an interned frozenset from the
+        trace reader, reuse one computed mask.
+
+        Returns:
+            Integer with one bit set per proposition holding after the event
+        """
+        mask = self._props_mask
+        if mask is not None:
+            return mask
+
+        mask = _prop_set_mask(self.props)
+        object.__setattr__(self, "_props_mask", mask)
+        return mask
+
     def __le__(self, other: Event) -> bool:
         """Determine causal ordering between events using vector clocks.
 
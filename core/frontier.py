@@ -4,14 +4,30 @@
 # Frontier representation for consistent global states in partial order executions
 
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Dict, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
-from .event import Event, VectorClock
+from .event import Event, VectorClock, prop_bit
 from utils.logger import get_logger
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=256)
+def _layout_index(layout: Tuple[str, ...]) -> Dict[str, int]:
+    """Return the process-to-position map for a frontier process layout.
+
+    Frontiers with the same layout share one map while it stays cached.
+
+    Args:
+        layout: Process identifiers in frontier order
+
+    Returns:
+        Dictionary mapping each process to its position in the layout
+    """
+    return {proc_id: i for i, proc_id in enumerate(layout)}
+
+
+@dataclass(frozen=True, slots=True)
 class Frontier:
     """Represents a consistent cut (global state) in partial order execution.
 
@@ -29,11 +45,26 @@ class Frontier:
     as dictionary keys, while providing convenient dictionary-style access to
     the underlying process-event mappings.
 
+    Like Event and VectorClock, instances use slots rather than a per-instance
+    dictionary; the process index, vector clock, proposition mask and hash
+    derived on demand are cached in slots of their own, which take no part
+    in equality, hashing or pickling.
+
     Attributes:
         events: Tuple of (process_id, event) pairs sorted by process identifier
     """
 
     events: Tuple[Tuple[str, Event], ...]
+    _index: Optional[Dict[str, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _vc: Optional[VectorClock] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _props_mask: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
 
     def __init__(self, events_dict: Dict[str, Event]) -> None:
         """Initialize frontier from process-event mapping.
@@ -52,9 +83,53 @@ class Frontier:
 
         sorted_items = tuple(sorted(events_dict.items()))
         object.__setattr__(self, "events", sorted_items)
+        object.__setattr__(self, "_index", None)
+        object.__setattr__(self, "_vc", None)
+        object.__setattr__(self, "_props_mask", None)
+        object.__setattr__(self, "_hash", None)
 
         logger.debug(f"Frontier created with processes: {list(events_dict.keys())}")
 
+    def __hash__(self) -> int:
+        """Hash the frontier's events, computing the hash once.
+
+        Frontiers are hashed whenever they enter the monitor's frontier set,
+        so the hash over the events tuple is kept after the first call.
+
+        Returns:
+            Hash consistent with the field-wise equality
+        """
+        result = self._hash
+        if result is None:
+            result = hash(self.events)
+            object.__setattr__(self, "_hash", result)
+        return result
+
+    def __getstate__(self) -> Tuple[Tuple[Tuple[str, Event], ...]]:
+        """Return the state to pickle, without the cached derived values.
+
+        The cached proposition mask and hash depend on per-process proposition
+        numbering and string hash salting, so they would be wrong in the
+        process that unpickles the frontier.
+
+        Returns:
+            One-element tuple holding the events tuple
+        """
+        return (self.events,)
+
+    def __setstate__(self, state: Tuple[Tuple[Tuple[str, Event], ...]]) -> None:
+        """Restore a pickled frontier with empty caches.
+
+        Args:
+            state: One-element tuple from ``__getstate__``
+        """
+        (events,) = state
+        object.__setattr__(self, "events", events)
+        object.__setattr__(self, "_index", None)
+        object.__setattr__(self, "_vc", None)
+        object.__setattr__(self, "_props_mask", None)
+        object.__setattr__(self, "_hash", None)
+
     @property
     def events_dict(self) -> Dict[str, Event]:
         """Convert frontier events to dictionary representation.
@@ -67,6 +142,27 @@ class Frontier:
         """
         return dict(self.events)
 
+    def event_for(self, proc: str) -> Optional[Event]:
+        """Look up the latest event of a single process in this frontier.
+
+        Unlike ``events_dict``, no dictionary is built per call: frontiers over
+        the same processes share one process-to-position index, and the event
+        is read straight from the sorted events tuple.
+
+        Args:
+            proc: Process identifier to look up
+
+        Returns:
+            Event for the process, or None if the frontier does not cover it
+        """
+        index = self._index
+        if index is None:
+            index = _layout_index(tuple(proc_id for proc_id, _ in self.events))
+            object.__setattr__(self, "_index", index)
+
+        position = index.get(proc)
+        return None if position is None else self.events[position][1]
+
     @property
     def vc(self) -> VectorClock:
         """Compute the vector clock representing this frontier's causal position.
@@ -79,30 +175,24 @@ class Frontier:
         represents the latest known information about all processes in the system,
         even those not directly represented in the frontier's events.
 
+        The clock is computed on first access and cached, so a frontier compared
+        against many others (N-block witnesses, P-block conjunctions) pays for
+        the maximum once and reuses the clock's packed comparison form.
+
         Returns:
             Vector clock representing the frontier's causal position
         """
-        if not self.events:
-            return VectorClock({})
+        if self._vc is not None:
+            return self._vc
 
-        # Collect all processes from all event vector clocks
-        all_processes = set()
-        for _, event in self.events:
-            all_processes.update(event.vc.clock_dict.keys())
-
-        # Compute component-wise maximum across all events
-        clock = {}
-        for proc in all_processes:
-            max_timestamp = 0
-            for _, event in self.events:
-                proc_timestamp = event.vc.clock_dict.get(proc, 0)
-                max_timestamp = max(max_timestamp, proc_timestamp)
-            clock[proc] = max_timestamp
+        # Compute component-wise maximum across all event vector clocks
+        vc = VectorClock.join([event.vc for _, event in self.events])
 
         logger = get_logger()
-        logger.debug(f"Computed frontier VC: {clock}")
+        logger.debug(f"Computed frontier VC: {vc}")
 
-        return VectorClock(clock)
+        object.__setattr__(self, "_vc", vc)
+        return vc
 
     def extend_with_event(self, event: Event) -> Frontier:
         """Create new frontier by incorporating an additional event.
@@ -123,6 +213,21 @@ class Frontier:
             f"Extending frontier with event {event.eid} on processes {event.processes}"
         )
 
+        # Usually the event's processes are already in the frontier: replace
+        # their entries in place, keeping the sorted order and reusing the
+        # (process, event) pairs of all other processes
+        items = []
+        replaced = 0
+        for item in self.events:
+            if item[0] in event.processes:
+                items.append((item[0], event))
+                replaced += 1
+            else:
+                items.append(item)
+        if replaced == len(event.processes):
+            logger.debug(f"New frontier will have {len(items)} process mappings")
+            return Frontier._from_sorted(tuple(items))
+
         new_events = self.events_dict
         for proc_id in event.processes:
             new_events[proc_id] = event
@@ -130,6 +235,43 @@ class Frontier:
         logger.debug(f"New frontier will have {len(new_events)} process mappings")
         return Frontier(new_events)
 
+    @classmethod
+    def _from_sorted(cls, events: Tuple[Tuple[str, Event], ...]) -> Frontier:
+        """Create a frontier from pairs already sorted by process identifier.
+
+        Args:
+            events: Sorted tuple of (process_id, event) pairs
+
+        Returns:
+            Frontier over the given pairs
+        """
+        frontier = object.__new__(cls)
+        object.__setattr__(frontier, "events", events)
+        object.__setattr__(frontier, "_index", None)
+        object.__setattr__(frontier, "_vc", None)
+        object.__setattr__(frontier, "_props_mask", None)
+        object.__setattr__(frontier, "_hash", None)
+        return frontier
+
+    @property
+    def props_mask(self) -> int:
+        """Bitmask of all propositions holding at some event of this frontier.
+
+        The union of the events' proposition masks is computed on first access
+        and cached, turning every later proposition lookup into one bitwise AND.
+
+        Returns:
+            Integer with one bit set per proposition present in the frontier
+        """
+        if self._props_mask is not None:
+            return self._props_mask
+
+        mask = 0
+        for _, event in self.events:
+            mask |= event.props_mask
+        object.__setattr__(self, "_props_mask", mask)
+        return mask
+
     def has_prop(self, prop_name: str) -> bool:
         """Check if any event in this frontier satisfies a given proposition.
 
@@ -143,7 +285,7 @@ class Frontier:
         Returns:
             True if any event in the frontier has the specified proposition
         """
-        result = any(event.has_prop(prop_name) for _, event in self.events)
+        result = bool(self.props_mask & prop_bit(prop_name))
 
         logger = get_logger()
         logger.debug(
@@ -4,52 +4,237 @@
 # Main PBTL monitor implementing the Section 4 algorithm
 
 from __future__ import annotations
-from dataclasses import dataclass, field
-from typing import Dict, List, Set, Optional
-from parser import parse_and_dlnf
+import copy
+import heapq
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Set,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from parser import parse_dlnf_disjuncts
 from parser.ast_nodes import EP, Or, And, Not, Literal, Expr
-from .event import Event, VectorClock
+from .event import Event, VectorClock, prop_bit
 from .frontier import Frontier
 from .verdict import Verdict
-from utils.logger import get_logger
+from utils.logger import LogLevel, get_logger
 
+# Bound on the block evaluations remembered per disjunct
+_BLOCK_MEMO_LIMIT = 4096
 
-def _holds(expr: Expr, frontier: Frontier) -> bool:
-    """Evaluate expression truth value on given frontier.
 
-    Recursively evaluates Boolean and temporal expressions against the
-    propositions available in the frontier state.
+@lru_cache(maxsize=256)
+def _compile_formula(formula_text: str) -> Tuple[EP, ...]:
+    """Parse a formula into its DLNF EP disjuncts, reusing earlier results.
+
+    Parsing and DLNF transformation are pure functions of the formula text and
+    the resulting AST nodes are immutable, so monitors built for the same
+    formula share them. Mutable tracking state lives in each monitor's
+    EPDisjunct instances, never in the cached nodes.
+
+    Disjunction is idempotent, so structurally equal disjuncts, such as the
+    two produced by EP(a | a), are kept once, in order of first appearance.
+
+    Args:
+        formula_text: PBTL formula string
+
+    Returns:
+        Tuple of EP nodes, one per DLNF disjunct
+
+    Raises:
+        ParseError: If the formula cannot be parsed
+        ValueError: If the DLNF result is not a disjunction of EP nodes
+    """
+    disjuncts = tuple(dict.fromkeys(parse_dlnf_disjuncts(formula_text)))
+    for disjunct in disjuncts:
+        if not isinstance(disjunct, EP):
+            raise ValueError(f"Expected DLNF (Or of EP), got: {type(disjunct)}")
+    return disjuncts
+
+
+def _stable_causal_order(events: Sequence[Event]) -> List[Event]:
+    """Order a batch of events causally, disturbing the given order least.
+
+    Events are emitted one at a time, each being the earliest event in the
+    batch whose causal predecessors within the batch have been emitted. An
+    event thus only moves behind events it causally depends on (and those
+    placed before them); concurrent events otherwise keep their batch order.
+
+    An event's direct predecessors are the events owning the timestamps its
+    clock refers to: its own previous timestamp on each participating
+    process and the latest timestamp it has seen of every other process.
+    Predecessors missing from the batch are left to causal delivery.
+
+    Args:
+        events: Batch of events in any order
+
+    Returns:
+        The batch events as a linear extension of their causal order
+    """
+    owners: Dict[Tuple[str, int], int] = {}
+    for index, event in enumerate(events):
+        for proc in event.processes:
+            owners.setdefault((proc, event.vc.timestamp(proc)), index)
+
+    waiting_on = [0] * len(events)
+    dependents: List[List[int]] = [[] for _ in events]
+    for index, event in enumerate(events):
+        for proc, timestamp in event.vc.clock:
+            if proc in event.processes:
+                timestamp -= 1
+            owner = owners.get((proc, timestamp)) if timestamp > 0 else None
+            if owner is not None and owner != index:
+                waiting_on[index] += 1
+                dependents[owner].append(index)
+
+    ready = [index for index, count in enumerate(waiting_on) if count == 0]
+    heapq.heapify(ready)
+    ordered = []
+    while ready:
+        index = heapq.heappop(ready)
+        ordered.append(events[index])
+        for dependent in dependents[index]:
+            waiting_on[dependent] -= 1
+            if waiting_on[dependent] == 0:
+                heapq.heappush(ready, dependent)
+
+    # Events caught in a dependency cycle, only possible with inconsistent
+    # clocks, are left to causal delivery in their batch order
+    if len(ordered) < len(events):
+        emitted = set(map(id, ordered))
+        ordered.extend(event for event in events if id(event) not in emitted)
+    return ordered
+
+
+@lru_cache(maxsize=64)
+def _initial_frontier(processes: FrozenSet[str]) -> Frontier:
+    """Build the initial frontier of a system, reusing earlier results.
+
+    Every process starts at the same synthetic iota event. The event and the
+    frontier are immutable, so monitors over the same process set share them
+    instead of rebuilding the clock, event and frontier on each initialization.
 
     Args:
-        expr: Expression to evaluate
-        frontier: Global state to evaluate against
+        processes: System process identifiers
 
     Returns:
-        True if expression holds in the frontier
+        Frontier mapping every process to the iota event
     """
+    iota_event = Event(
+        eid="iota",
+        processes=processes,
+        vc=VectorClock({p: 0 for p in processes}),
+        props=frozenset(["iota"]),
+    )
+    return Frontier({p: iota_event for p in processes})
+
+
+def _literal_mask(expr: Expr) -> Optional[int]:
+    """Return the proposition bit of an expression that is a single proposition.
+
+    Args:
+        expr: Expression to encode
+
+    Returns:
+        Bit assigned by ``prop_bit``, or None if the expression is not a
+        proposition literal (the constants true and false included)
+    """
+    if isinstance(expr, Literal) and expr.name not in ("true", "false"):
+        return prop_bit(expr.name)
+    return None
+
+
+def _conjunction_mask(expr: Expr) -> Optional[int]:
+    """Return the proposition bits of an expression that is a plain conjunction.
+
+    A conjunction of propositions holds exactly when all of its bits are set,
+    so it is decided by a single AND and comparison. The constant true adds no
+    bit.
+
+    Args:
+        expr: Expression to encode
+
+    Returns:
+        Union of the conjuncts' bits, or None if some conjunct is not a
+        proposition literal or the constant true
+    """
+    if isinstance(expr, And):
+        left = _conjunction_mask(expr.left)
+        if left is None:
+            return None
+        right = _conjunction_mask(expr.right)
+        return None if right is None else left | right
+    if isinstance(expr, Literal) and expr.name == "true":
+        return 0
+    return _literal_mask(expr)
+
+
+def _compile_guard(expr: Expr) -> Callable[[int], bool]:
+    """Lower an expression to a predicate over a proposition bitmask.
+
+    The AST is walked once, here: conjunctions of propositions become a single
+    mask test and the remaining Boolean structure becomes nested closures, so
+    evaluating the guard dispatches on no node types. EP is transparent: the
+    monitor handles its temporal meaning through P- and N-block tracking.
+
+    Args:
+        expr: Expression to compile
+
+    Returns:
+        Function taking a ``prop_bit`` bitmask and returning whether the
+        expression holds for it
+
+    Raises:
+        ValueError: If the expression contains an unknown node type
+    """
+    mask = _conjunction_mask(expr)
+    if mask is not None:
+        return lambda props_mask: props_mask & mask == mask
+
     if isinstance(expr, Literal):
-        if expr.name == "true":
-            return True
-        elif expr.name == "false":
-            return False
-        else:
-            return frontier.has_prop(expr.name)
+        # Proposition literals and true have masks, leaving the constant false
+        return lambda props_mask: False
+
+    if isinstance(expr, EP):
+        return _compile_guard(expr.operand)
 
-    elif isinstance(expr, Not):
-        return not _holds(expr.operand, frontier)
+    if isinstance(expr, Not):
+        operand = _compile_guard(expr.operand)
+        return lambda props_mask: not operand(props_mask)
 
-    elif isinstance(expr, And):
-        return _holds(expr.left, frontier) and _holds(expr.right, frontier)
+    if isinstance(expr, (And, Or)):
+        left = _compile_guard(expr.left)
+        right = _compile_guard(expr.right)
+        if isinstance(expr, And):
+            return lambda props_mask: left(props_mask) and right(props_mask)
+        return lambda props_mask: left(props_mask) or right(props_mask)
 
-    elif isinstance(expr, Or):
-        return _holds(expr.left, frontier) or _holds(expr.right, frontier)
+    raise ValueError(f"Unknown expression type: {type(expr)}")
 
-    elif isinstance(expr, EP):
-        # EP semantics handled by monitor context
-        return _holds(expr.operand, frontier)
 
-    else:
-        raise ValueError(f"Unknown expression type: {type(expr)}")
+def _relevant_mask(expr: Expr) -> int:
+    """Collect the proposition bits an expression's truth can depend on.
+
+    Args:
+        expr: Expression to scan
+
+    Returns:
+        Union of the bits of every proposition literal in the expression
+    """
+    if isinstance(expr, Literal):
+        return 0 if expr.name in ("true", "false") else prop_bit(expr.name)
+    if isinstance(expr, (Not, EP)):
+        return _relevant_mask(expr.operand)
+    if isinstance(expr, (And, Or)):
+        return _relevant_mask(expr.left) | _relevant_mask(expr.right)
+    raise ValueError(f"Unknown expression type: {type(expr)}")
 
 
 @dataclass
@@ -71,6 +256,20 @@ class EPDisjunct:
         m_search_active: Whether M-search is active
         verdict: Current disjunct verdict
         success_frontier: Frontier where success occurred
+        case: Table 1 case, fixed once the blocks are populated
+        m_masks: (required, forbidden) proposition bitmasks equivalent to the
+            M-literals, or None if they are not all plain or negated literals
+        p_masks: Proposition bits of each P-block over a conjunction of
+            propositions, None for the other P-blocks
+        n_masks: Proposition bits of each N-block over a conjunction of
+            propositions, None for the other N-blocks
+        block_relevance: Bits of the propositions each P/N-block mentions,
+            P-blocks first
+        block_guards: Compiled predicate of each P/N-block, P-blocks first
+        m_guards: Compiled predicate of each M-literal
+        block_memo: Results of evaluating the unmasked P/N-blocks, keyed by
+            block position (N-blocks after P-blocks) and the relevant part of
+            the proposition bitmask
     """
 
     ep_formula: EP
@@ -83,9 +282,34 @@ class EPDisjunct:
     m_search_active: bool = False
     verdict: Verdict = Verdict.UNKNOWN
     success_frontier: Optional[Frontier] = None
+    case: str = "EMPTY"
+    m_masks: Optional[Tuple[int, int]] = None
+    p_masks: Tuple[Optional[int], ...] = ()
+    n_masks: Tuple[Optional[int], ...] = ()
+    block_relevance: Tuple[int, ...] = ()
+    block_guards: Tuple[Callable[[int], bool], ...] = field(
+        default=(), repr=False, compare=False
+    )
+    m_guards: Tuple[Callable[[int], bool], ...] = field(
+        default=(), repr=False, compare=False
+    )
+    block_memo: Dict[Tuple[int, int], bool] = field(default_factory=dict)
 
     def initialize_satisfaction_tracking(self):
         """Initialize satisfaction tracking after block population."""
+        self.case = self.case_type()
+        self.m_masks = self._compile_m_masks()
+        self.p_masks = tuple(_conjunction_mask(b.operand) for b in self.p_blocks)
+        self.n_masks = tuple(_conjunction_mask(b.operand) for b in self.n_blocks)
+        blocks = self.p_blocks + self.n_blocks
+        self.block_relevance = tuple(_relevant_mask(b) for b in blocks)
+        self.block_guards = tuple(_compile_guard(b) for b in blocks)
+        self.m_guards = tuple(_compile_guard(m) for m in self.m_literals)
+        self.reset_state()
+
+    def reset_state(self) -> None:
+        """Forget all satisfaction progress, keeping the compiled blocks."""
+        self.block_memo.clear()
         self.p_satisfied_at.clear()
         self.n_satisfied_at.clear()
 
@@ -94,6 +318,155 @@ class EPDisjunct:
         for i in range(len(self.n_blocks)):
             self.n_satisfied_at[i] = None
 
+        self.m_vector.clear()
+        self.m_search_active = False
+        self.verdict = Verdict.UNKNOWN
+        self.success_frontier = None
+
+    def copy(self) -> EPDisjunct:
+        """Copy this disjunct with its own tracking containers.
+
+        The compiled parts (masks, guards) are shared with the copy; block
+        lists and satisfaction state are duplicated, and the copy starts with
+        an empty block memo of its own.
+
+        Returns:
+            Disjunct in the same state, independent of this one
+        """
+        return replace(
+            self,
+            p_blocks=list(self.p_blocks),
+            m_literals=list(self.m_literals),
+            n_blocks=list(self.n_blocks),
+            p_satisfied_at=dict(self.p_satisfied_at),
+            n_satisfied_at=dict(self.n_satisfied_at),
+            m_vector=dict(self.m_vector),
+            block_memo={},
+        )
+
+    def _compile_m_masks(self) -> Optional[Tuple[int, int]]:
+        """Encode the M-literals as required and forbidden proposition bits.
+
+        A minterm of propositions and negated propositions holds exactly when
+        all required bits are present and no forbidden bit is.
+
+        Returns:
+            Tuple of (required, forbidden) bitmasks, or None if some M-literal
+            is not a plain or negated proposition
+        """
+        required = 0
+        forbidden = 0
+        for m_literal in self.m_literals:
+            negated = isinstance(m_literal, Not)
+            bit = _literal_mask(m_literal.operand if negated else m_literal)
+            if bit is None:
+                return None
+            if negated:
+                forbidden |= bit
+            else:
+                required |= bit
+        return required, forbidden
+
+    def any_m_literal_holds(self, props_mask: int) -> bool:
+        """Check whether some M-literal holds on a set of propositions.
+
+        Args:
+            props_mask: Bitmask of the propositions that hold
+
+        Returns:
+            True if at least one M-literal is satisfied
+        """
+        if self.m_masks is not None:
+            required, forbidden = self.m_masks
+            # A plain literal holds if its bit is set, a negated one if not
+            return bool(props_mask & required or forbidden & ~props_mask)
+        return any(guard(props_mask) for guard in self.m_guards)
+
+    def p_block_holds(self, i: int, props_mask: int) -> bool:
+        """Check whether a P-block's operand holds on a set of propositions.
+
+        Args:
+            i: Position of the P-block
+            props_mask: Bitmask of the propositions that hold
+
+        Returns:
+            True if the P-block is satisfied
+        """
+        block_mask = self.p_masks[i]
+        if block_mask is not None:
+            return props_mask & block_mask == block_mask
+        return self._memoized_holds(i, props_mask)
+
+    def n_block_holds(self, i: int, props_mask: int) -> bool:
+        """Check whether an N-block's operand holds on a set of propositions.
+
+        Args:
+            i: Position of the N-block
+            props_mask: Bitmask of the propositions that hold
+
+        Returns:
+            True if the N-block is satisfied
+        """
+        block_mask = self.n_masks[i]
+        if block_mask is not None:
+            return props_mask & block_mask == block_mask
+        return self._memoized_holds(len(self.p_blocks) + i, props_mask)
+
+    def _memoized_holds(self, key: int, props_mask: int) -> bool:
+        """Evaluate a block without a compiled mask, remembering the result.
+
+        A block's truth depends only on which of its own propositions are
+        present. Masking the rest away keys the memo by that subset, so each
+        nested block is walked at most once per combination of its
+        propositions, however many others the frontiers carry.
+
+        Args:
+            key: Block position, with N-blocks numbered after the P-blocks
+            props_mask: Bitmask of the propositions that hold
+
+        Returns:
+            True if the block is satisfied
+        """
+        props_mask &= self.block_relevance[key]
+        memo_key = (key, props_mask)
+        result = self.block_memo.get(memo_key)
+        if result is None:
+            if len(self.block_memo) >= _BLOCK_MEMO_LIMIT:
+                self.block_memo.clear()
+            result = self.block_memo[memo_key] = self.block_guards[key](props_mask)
+        return result
+
+    def n_blocks_pending(self, props_mask: int) -> bool:
+        """Check whether an event may newly satisfy one of the N-blocks.
+
+        Each new frontier only swaps older events for the delivered one, so a
+        masked N-block that held on none of the earlier frontiers can only
+        start to hold if the event carries one of its propositions. N-blocks
+        without a mask are always treated as pending.
+
+        Args:
+            props_mask: Bitmask of the delivered event's propositions
+
+        Returns:
+            True if some unsatisfied N-block needs checking on the new frontiers
+        """
+        for i, block_mask in enumerate(self.n_masks):
+            if self.n_satisfied_at[i] is None:
+                if block_mask is None or not block_mask or props_mask & block_mask:
+                    return True
+        return False
+
+    def any_n_block_holds(self, props_mask: int) -> bool:
+        """Check whether some N-block's operand holds on a set of propositions.
+
+        Args:
+            props_mask: Bitmask of the propositions that hold
+
+        Returns:
+            True if at least one N-block is satisfied
+        """
+        return any(self.n_block_holds(i, props_mask) for i in range(len(self.n_blocks)))
+
     def case_type(self) -> str:
         """Determine which Table 1 case this disjunct represents.
 
@@ -122,6 +495,54 @@ class EPDisjunct:
             return "EMPTY"
 
 
+def _flatten_conjuncts(expr: Expr) -> List[Expr]:
+    """Flatten nested And expressions into conjunct list.
+
+    Conjunction is idempotent, so repeated conjuncts such as the two in
+    a & a are kept once, in order of first appearance.
+
+    Args:
+        expr: Expression to flatten
+
+    Returns:
+        List of distinct conjunct expressions
+    """
+    if isinstance(expr, And):
+        conjuncts = _flatten_conjuncts(expr.left) + _flatten_conjuncts(expr.right)
+        return list(dict.fromkeys(conjuncts))
+    else:
+        return [expr]
+
+
+@lru_cache(maxsize=256)
+def _compile_disjunct(ep_node: EP) -> EPDisjunct:
+    """Partition an EP node into P/M/N components, reusing earlier results.
+
+    Partitioning and block compilation depend only on the EP node. The
+    cached disjunct is a template in its initial state: monitors only ever
+    receive copies of it, so it never tracks a trace itself.
+
+    Args:
+        ep_node: EP node to partition
+
+    Returns:
+        Compiled EPDisjunct template
+    """
+    disjunct = EPDisjunct(ep_formula=ep_node)
+
+    # Partition conjuncts by type
+    for conjunct in _flatten_conjuncts(ep_node.operand):
+        if isinstance(conjunct, EP):
+            disjunct.p_blocks.append(conjunct)
+        elif isinstance(conjunct, Not) and isinstance(conjunct.operand, EP):
+            disjunct.n_blocks.append(conjunct.operand)
+        else:
+            disjunct.m_literals.append(conjunct)
+
+    disjunct.initialize_satisfaction_tracking()
+    return disjunct
+
+
 @dataclass
 class PBTLMonitor:
     """Main PBTL monitor implementing the Section 4 algorithm.
@@ -139,6 +560,12 @@ class PBTLMonitor:
         initial_frontier: Initial system state
         global_verdict: Combined verdict from all disjuncts
         verbose: Debug output control
+        single_process: Whether the system consists of exactly one process
+        assume_ordered: Whether events are known to arrive in a causal order,
+            letting them bypass the causal delivery buffer
+        stop_on_verdict: Whether events arriving after the global verdict
+            became conclusive are ignored
+        finalized: Whether finalize() has already settled the verdicts
     """
 
     formula_text: str
@@ -150,78 +577,38 @@ class PBTLMonitor:
     initial_frontier: Optional[Frontier] = None
     global_verdict: Verdict = Verdict.UNKNOWN
     verbose: bool = False
+    single_process: bool = False
+    assume_ordered: bool = False
+    stop_on_verdict: bool = False
+    finalized: bool = False
 
     def __post_init__(self):
         """Parse formula and initialize EP disjuncts."""
         logger = get_logger()
         logger.debug(f"Initializing monitor for formula: {self.formula_text}")
 
-        # Parse to DLNF
-        dlnf_ast = parse_and_dlnf(self.formula_text)
-
-        # Extract and create EP disjuncts
-        ep_nodes = self._extract_ep_disjuncts(dlnf_ast)
+        # Parse to DLNF and extract EP disjuncts (cached per formula text)
+        ep_nodes = _compile_formula(self.formula_text)
         for ep_node in ep_nodes:
             disjunct = self._create_ep_disjunct(ep_node)
             self.disjuncts.append(disjunct)
 
         logger.debug(f"Created {len(self.disjuncts)} EP disjuncts")
 
-    def _extract_ep_disjuncts(self, ast: Expr) -> List[EP]:
-        """Extract all EP nodes from DLNF structure.
-
-        Args:
-            ast: DLNF AST (disjunction of EP nodes)
-
-        Returns:
-            List of EP nodes representing disjuncts
-        """
-        if isinstance(ast, EP):
-            return [ast]
-        elif isinstance(ast, Or):
-            return self._extract_ep_disjuncts(ast.left) + self._extract_ep_disjuncts(
-                ast.right
-            )
-        else:
-            raise ValueError(f"Expected DLNF (Or of EP), got: {type(ast)}")
-
     def _create_ep_disjunct(self, ep_node: EP) -> EPDisjunct:
         """Create EPDisjunct by partitioning operand into P/M/N components.
 
+        Partitioning and block compilation depend only on the EP node, so
+        each node is compiled once into a template and every monitor gets
+        its own copy of it.
+
         Args:
             ep_node: EP node to partition
 
         Returns:
             Configured EPDisjunct instance
         """
-        disjunct = EPDisjunct(ep_formula=ep_node)
-        conjuncts = self._flatten_and(ep_node.operand)
-
-        # Partition conjuncts by type
-        for conjunct in conjuncts:
-            if isinstance(conjunct, EP):
-                disjunct.p_blocks.append(conjunct)
-            elif isinstance(conjunct, Not) and isinstance(conjunct.operand, EP):
-                disjunct.n_blocks.append(conjunct.operand)
-            else:
-                disjunct.m_literals.append(conjunct)
-
-        disjunct.initialize_satisfaction_tracking()
-        return disjunct
-
-    def _flatten_and(self, expr: Expr) -> List[Expr]:
-        """Flatten nested And expressions into conjunct list.
-
-        Args:
-            expr: Expression to flatten
-
-        Returns:
-            List of conjunct expressions
-        """
-        if isinstance(expr, And):
-            return self._flatten_and(expr.left) + self._flatten_and(expr.right)
-        else:
-            return [expr]
+        return _compile_disjunct(ep_node).copy()
 
     def set_verbose(self, verbose: bool) -> None:
         """Configure verbose output mode.
@@ -231,23 +618,59 @@ class PBTLMonitor:
         """
         self.verbose = verbose
 
+    def clone(self) -> PBTLMonitor:
+        """Create an independent copy of this monitor in its current state.
+
+        The copy shares the immutable parts (formula AST nodes, events,
+        frontiers and compiled guards) with the original and duplicates every
+        mutable container, so feeding events to one monitor never affects the
+        other. This avoids
+        re-running formula setup when many traces are checked against the
+        same formula and process set.
+
+        Returns:
+            New monitor with the same formula, verdicts and delivery state
+        """
+        twin = copy.copy(self)
+        twin.disjuncts = [disjunct.copy() for disjunct in self.disjuncts]
+        twin.seen_events = dict(self.seen_events)
+        twin.event_buffer = list(self.event_buffer)
+        twin.current_frontiers = set(self.current_frontiers)
+        twin.all_processes = set(self.all_processes)
+        return twin
+
+    def reset(self) -> None:
+        """Return this monitor to its freshly constructed state, in place.
+
+        Delivery state, frontiers and verdicts are cleared while the parsed
+        formula and the compiled disjunct blocks are kept, so one monitor can
+        check many traces against its formula without being rebuilt. As after
+        construction, processes are taken from the next trace's declaration
+        or from the first event processed.
+        """
+        for disjunct in self.disjuncts:
+            disjunct.reset_state()
+
+        self.seen_events.clear()
+        self.event_buffer.clear()
+        self.current_frontiers.clear()
+        self.all_processes.clear()
+        self.initial_frontier = None
+        self.global_verdict = Verdict.UNKNOWN
+        self.single_process = False
+        self.finalized = False
+
     def initialize_from_trace_processes(self, processes: List[str]) -> None:
         """Initialize monitor with system processes from trace."""
         logger = get_logger()
         self.all_processes = set(processes)
+        self.single_process = len(self.all_processes) == 1
 
         if self.all_processes:
             logger.info(f"Initialized with processes: {sorted(self.all_processes)}")
 
         # Create initial frontier with iota event
-        iota_event = Event(
-            eid="iota",
-            processes=frozenset(self.all_processes),
-            vc=VectorClock({p: 0 for p in self.all_processes}),
-            props=frozenset(["iota"]),
-        )
-
-        self.initial_frontier = Frontier({p: iota_event for p in self.all_processes})
+        self.initial_frontier = _initial_frontier(frozenset(self.all_processes))
         self.current_frontiers.add(self.initial_frontier)
 
         # Initialize M-search for applicable cases
@@ -265,15 +688,14 @@ class PBTLMonitor:
                 continue
 
             # Check all frontiers (should just be initial frontier at this point)
-            for frontier in self.current_frontiers:
-                self._update_disjunct_with_frontier(disjunct, frontier)
+            self._update_disjunct_with_frontiers(disjunct, self.current_frontiers)
 
         self._update_global_verdict()
 
     def _initialize_m_search(self):
         """Initialize M-search for applicable disjuncts."""
         for disjunct in self.disjuncts:
-            if disjunct.case_type() in ("M", "M+N") and not disjunct.m_search_active:
+            if disjunct.case in ("M", "M+N") and not disjunct.m_search_active:
                 self._init_m_search(disjunct)
 
     def print_header(self) -> None:
@@ -292,9 +714,17 @@ class PBTLMonitor:
     def process_event(self, event: Event) -> None:
         """Process new event using causal delivery.
 
+        Once the global verdict is conclusive it can no longer change. With
+        ``stop_on_verdict`` set, later events are then dropped without
+        buffering, delivery checks or frontier updates; individual disjunct
+        verdicts are not updated any further either.
+
         Args:
             event: Distributed system event to process
         """
+        if self.stop_on_verdict and self.global_verdict.is_conclusive():
+            return
+
         logger = get_logger()
         logger.debug(f"Processing event: {event.eid}")
 
@@ -303,33 +733,134 @@ class PBTLMonitor:
             self.all_processes.update(event.processes)
             self._initialize_system()
 
-        # Buffer and attempt delivery
-        self.event_buffer.append(event)
-        self._try_deliver_events()
+        # Callers that guarantee a causal order skip the buffer entirely
+        if self.assume_ordered:
+            self._deliver_event(event)
+            return
 
-    def _initialize_system(self) -> None:
-        """Initialize system state with iota frontier."""
-        iota_event = Event(
-            eid="iota",
-            processes=frozenset(self.all_processes),
-            vc=VectorClock({p: 0 for p in self.all_processes}),
-            props=frozenset(["iota"]),
+        # Nothing buffered was deliverable before this event arrived, so an
+        # event that is not deliverable itself changes nothing and just waits.
+        # Delivering one may unblock buffered events.
+        if self._is_deliverable(event):
+            self._deliver_event(event)
+            if self.event_buffer:
+                self._try_deliver_events()
+        else:
+            self.event_buffer.append(event)
+
+    def process_events(self, events: Iterable[Event]) -> Verdict:
+        """Process a sequence of events in order using causal delivery.
+
+        Conclusive disjunct verdicts never change, so once the global verdict
+        is TRUE or FALSE the remaining events cannot affect it. With
+        ``stop_on_verdict`` set they are then not consumed; otherwise they are
+        still delivered so every disjunct gets its own verdict.
+
+        Args:
+            events: Distributed system events, typically a whole trace
+
+        Returns:
+            Global verdict after the events have been processed
+        """
+        process_event = self.process_event
+        for event in events:
+            process_event(event)
+            if self.stop_on_verdict and self.global_verdict.is_conclusive():
+                break
+        return self.global_verdict
+
+    def process_in_causal_order(self, events: Iterable[Event]) -> Verdict:
+        """Reorder a batch of events causally, then process it.
+
+        Unlike ``process_events``, which delivers events as they arrive and
+        buffers the ones that are not yet deliverable, this method first puts
+        the whole batch in a stable causal order: an event is moved behind the
+        events it causally depends on, and concurrent events otherwise keep
+        their relative order from the batch. Events are then delivered as
+        they come instead of waiting in the causal buffer to be rescanned
+        after every delivery.
+
+        For a batch that is already in causal order both methods deliver the
+        events as given and reach the same verdicts. Otherwise both deliver
+        the events in an order consistent with causality, but not necessarily
+        the same one: the buffer releases waiting events pass by pass in
+        arrival order, so an event that becomes deliverable during a pass can
+        be released after concurrent events that arrived later than it. The
+        monitor follows a single frontier, so such a difference in the order
+        of concurrent events can change verdicts.
+
+        Args:
+            events: Distributed system events, in any order
+
+        Returns:
+            Global verdict after the batch has been processed
+        """
+        return self.process_events(_stable_causal_order(list(events)))
+
+    def process_rows(
+        self,
+        processes: Sequence[str],
+        rows: Iterable[Tuple[str, Iterable[str], Sequence[int], Iterable[str]]],
+    ) -> Verdict:
+        """Process a trace given as rows of positional timestamps.
+
+        Each row describes one event as (event id, participating processes,
+        timestamps in ``processes`` order, propositions). Events are built one
+        at a time as they are consumed, so with ``stop_on_verdict`` set, rows
+        after a conclusive verdict are never turned into events.
+
+        Args:
+            processes: Process identifiers giving the meaning of each timestamp
+            rows: Event rows in trace order
+
+        Returns:
+            Global verdict after the rows have been processed
+
+        Raises:
+            ValueError: If a row's timestamps do not match ``processes`` in length
+        """
+        return self.process_events(
+            Event(
+                eid=eid,
+                processes=frozenset(procs),
+                vc=VectorClock.from_row(clock, processes),
+                props=frozenset(props),
+            )
+            for eid, procs, clock, props in rows
         )
 
-        self.initial_frontier = Frontier({p: iota_event for p in self.all_processes})
+    def _initialize_system(self) -> None:
+        """Initialize system state with iota frontier."""
+        self.single_process = len(self.all_processes) == 1
+        self.initial_frontier = _initial_frontier(frozenset(self.all_processes))
         self.current_frontiers.add(self.initial_frontier)
         self._initialize_m_search()
 
     def _try_deliver_events(self) -> None:
-        """Deliver causally ready events from buffer."""
+        """Deliver causally ready events from buffer.
+
+        Each pass walks the buffer in arrival order, delivering every ready
+        event and collecting the rest for the next pass, so delivered events
+        are dropped without searching the list for them. Passes repeat while
+        some event was delivered.
+
+        The monitor follows a single frontier, so the order in which
+        concurrent events are delivered can change verdicts; buffered events
+        are therefore never reordered beyond what causality requires.
+        """
+        pending = self.event_buffer
         delivered_any = True
         while delivered_any:
             delivered_any = False
-            for event in list(self.event_buffer):
+            waiting = []
+            for event in pending:
                 if self._is_deliverable(event):
                     self._deliver_event(event)
-                    self.event_buffer.remove(event)
                     delivered_any = True
+                else:
+                    waiting.append(event)
+            pending = waiting
+        self.event_buffer = pending
 
     def _is_deliverable(self, event: Event) -> bool:
         """Check if event satisfies causal delivery constraints.
@@ -340,19 +871,30 @@ class PBTLMonitor:
         Returns:
             True if event can be delivered now
         """
-        event_vc_dict = event.vc.clock_dict
+        seen_events = self.seen_events
+
+        # Single-process events, the common case, need one timestamp check
+        # and one pass over the clock
+        if len(event.processes) == 1:
+            (owner,) = event.processes
+            if event.vc.timestamp(owner) != seen_events.get(owner, 0) + 1:
+                return False
+            for proc, ts in event.vc.clock:
+                if ts > seen_events.get(proc, 0) and proc != owner:
+                    return False
+            return True
 
         # Check participating processes have correct timestamps
         for proc in event.processes:
-            expected_ts = self.seen_events.get(proc, 0) + 1
-            actual_ts = event_vc_dict.get(proc, 0)
+            expected_ts = seen_events.get(proc, 0) + 1
+            actual_ts = event.vc.timestamp(proc)
             if actual_ts != expected_ts:
                 return False
 
         # Check no process has advanced beyond event's knowledge
-        for proc, ts in event_vc_dict.items():
+        for proc, ts in event.vc.clock:
             if proc not in event.processes:
-                if ts > self.seen_events.get(proc, 0):
+                if ts > seen_events.get(proc, 0):
                     return False
 
         return True
@@ -367,9 +909,8 @@ class PBTLMonitor:
         logger.debug(f"Delivering event: {event.eid}")
 
         # Update causal delivery state
-        event_vc_dict = event.vc.clock_dict
         for proc in event.processes:
-            self.seen_events[proc] = event_vc_dict[proc]
+            self.seen_events[proc] = event.vc.timestamp(proc)
 
         # Generate new frontiers
         new_frontiers = set()
@@ -379,9 +920,10 @@ class PBTLMonitor:
 
         self.current_frontiers = new_frontiers
 
-        # Update all disjuncts
-        self._update_disjuncts(event, new_frontiers)
-        self._update_global_verdict()
+        # Update all disjuncts. Conclusive disjunct verdicts are sticky, so a
+        # final global verdict never changes, but the remaining disjuncts may
+        # still hold and are reported at finalization
+        self.global_verdict = self._update_disjuncts(event, new_frontiers)
 
         # Cleanup irrelevant events
         # self._cleanup_irrelevant_events()
@@ -403,35 +945,94 @@ class PBTLMonitor:
             for proc, event in disjunct.m_vector.items():
                 # Check if this event can be superseded
                 for frontier in self.current_frontiers:
-                    frontier_dict = frontier.events_dict
-                    if proc in frontier_dict:
-                        newer_event = frontier_dict[proc]
-                        # If newer event exists and event is older
-                        if event.vc < newer_event.vc:
-                            events_to_remove.add(event)
+                    newer_event = frontier.event_for(proc)
+                    # If newer event exists and event is older
+                    if newer_event is not None and event.vc < newer_event.vc:
+                        events_to_remove.add(event)
 
         # Remove from internal tracking (implementation would depend on data structures)
         if events_to_remove:
             logger.debug(f"Cleaned up {len(events_to_remove)} irrelevant events")
 
-    def _update_disjuncts(self, event: Event, frontiers: Set[Frontier]) -> None:
+    def _update_disjuncts(self, event: Event, frontiers: Set[Frontier]) -> Verdict:
         """Update all disjunct states with new frontiers.
 
+        The global verdict is combined from the disjunct verdicts in the same
+        pass, so no second walk over the disjuncts is needed afterwards. Every
+        disjunct is updated, even after one has become TRUE, so the
+        per-disjunct verdicts reported at finalization stay accurate.
+
         Args:
             event: Delivered event
             frontiers: New frontier set
+
+        Returns:
+            Global verdict implied by the updated disjuncts
         """
+        any_true = False
+        all_false = True
+
         for disjunct in self.disjuncts:
-            if disjunct.verdict.is_conclusive():
-                continue
+            verdict = disjunct.verdict
+            if not verdict.is_conclusive():
+                if disjunct.case == "M" and disjunct.m_masks is not None:
+                    # Plain minterms such as EP(p) need no M-vector or witnesses
+                    verdict = self._update_minterm_disjunct(disjunct, event, frontiers)
+                else:
+                    # Update M-vector if active
+                    if disjunct.m_search_active:
+                        self._update_m_vector(disjunct, event)
+
+                    # Check satisfaction on all new frontiers
+                    verdict = self._update_disjunct_with_frontiers(
+                        disjunct,
+                        frontiers,
+                        check_n=disjunct.n_blocks_pending(event.props_mask),
+                    )
+
+            if verdict == Verdict.TRUE:
+                any_true = True
+            elif verdict != Verdict.FALSE:
+                all_false = False
+
+        if any_true:
+            return Verdict.TRUE
+        return Verdict.FALSE if all_false else Verdict.UNKNOWN
+
+    def _update_minterm_disjunct(
+        self, disjunct: EPDisjunct, event: Event, frontiers: Iterable[Frontier]
+    ) -> Verdict:
+        """Update a Case 7 disjunct whose M-literals compiled to masks.
+
+        Such a disjunct, e.g. EP(p) or EP(p & !q), has no blocks to witness
+        and becomes TRUE on the first frontier whose propositions satisfy the
+        minterm, so the frontiers are checked directly without the M-vector
+        and case dispatch of the general path.
+
+        Without negated literals the check is skipped for events carrying none
+        of the required propositions: each new frontier only swaps older
+        events for this one, so its required propositions are a subset of
+        those of the frontier it extends, which did not satisfy the minterm.
 
-            # Update M-vector if active
-            if disjunct.m_search_active:
-                self._update_m_vector(disjunct, event)
+        Args:
+            disjunct: Case 7 disjunct with ``m_masks`` set
+            event: Delivered event
+            frontiers: New frontiers to check
+
+        Returns:
+            The disjunct's verdict after the update
+        """
+        required, forbidden = disjunct.m_masks
+        if not forbidden and not event.props_mask & required:
+            return disjunct.verdict
 
-            # Check satisfaction on all new frontiers
-            for frontier in frontiers:
-                self._update_disjunct_with_frontier(disjunct, frontier)
+        for frontier in frontiers:
+            props_mask = frontier.props_mask
+            if props_mask & required == required and not props_mask & forbidden:
+                disjunct.verdict = Verdict.TRUE
+                disjunct.success_frontier = frontier
+                break
+        return disjunct.verdict
 
     def _print_event_result(self, event: Event, frontiers: Set[Frontier]) -> None:
         """Print event processing result.
@@ -441,6 +1042,9 @@ class PBTLMonitor:
             frontiers: Resulting frontier set
         """
         logger = get_logger()
+        if not logger.is_enabled_for(LogLevel.INFO):
+            # Sorting and formatting every frontier is wasted when not shown
+            return
 
         # Format event information
         procs = ",".join(sorted(event.processes))
@@ -459,28 +1063,41 @@ class PBTLMonitor:
 
         logger.event_processed(event_str, frontiers_str, verdict_str)
 
-    def _update_disjunct_with_frontier(
-        self, disjunct: EPDisjunct, frontier: Frontier
-    ) -> None:
-        """Update disjunct satisfaction state with frontier.
+    def _update_disjunct_with_frontiers(
+        self,
+        disjunct: EPDisjunct,
+        frontiers: Iterable[Frontier],
+        check_n: bool = True,
+    ) -> Verdict:
+        """Update disjunct satisfaction state with a batch of frontiers.
+
+        Frontiers are checked in turn until the disjunct's verdict becomes
+        conclusive; the remaining frontiers cannot change it.
 
         Args:
             disjunct: Disjunct to update
-            frontier: New frontier to check
+            frontiers: New frontiers to check
+            check_n: Whether N-blocks may become satisfied on these frontiers;
+                False skips the N-block checks
+
+        Returns:
+            The disjunct's verdict after the update
         """
-        logger = get_logger()
+        for frontier in frontiers:
+            if disjunct.verdict.is_conclusive():
+                return disjunct.verdict
 
-        if disjunct.verdict.is_conclusive():
-            return
+            # Check P-block satisfaction
+            self._check_p_block_satisfaction(disjunct, frontier)
 
-        # Check P-block satisfaction
-        self._check_p_block_satisfaction(disjunct, frontier)
+            # Check N-block satisfaction
+            if check_n:
+                self._check_n_block_satisfaction(disjunct, frontier)
 
-        # Check N-block satisfaction
-        self._check_n_block_satisfaction(disjunct, frontier)
+            # Apply case-specific logic
+            self._apply_case_logic(disjunct, frontier)
 
-        # Apply case-specific logic
-        self._apply_case_logic(disjunct, frontier)
+        return disjunct.verdict
 
     def _check_p_block_satisfaction(
         self, disjunct: EPDisjunct, frontier: Frontier
@@ -493,9 +1110,10 @@ class PBTLMonitor:
         """
         logger = get_logger()
 
+        props_mask = frontier.props_mask
         for i in range(len(disjunct.p_blocks)):
             if disjunct.p_satisfied_at[i] is None:
-                if _holds(disjunct.p_blocks[i], frontier):
+                if disjunct.p_block_holds(i, props_mask):
                     minimal_frontier = self._create_minimal_p_frontier(
                         disjunct.p_blocks[i], frontier
                     )
@@ -515,9 +1133,10 @@ class PBTLMonitor:
         """
         logger = get_logger()
 
+        props_mask = frontier.props_mask
         for i in range(len(disjunct.n_blocks)):
             if disjunct.n_satisfied_at[i] is None:
-                if _holds(disjunct.n_blocks[i], frontier):
+                if disjunct.n_block_holds(i, props_mask):
                     minimal_frontier = self._create_minimal_n_frontier(
                         disjunct.n_blocks[i], frontier
                     )
@@ -539,14 +1158,14 @@ class PBTLMonitor:
             Minimal satisfying frontier
         """
         if isinstance(p_block.operand, Literal):
-            prop_name = p_block.operand.name
+            prop_mask = prop_bit(p_block.operand.name)
             target_event = None
             min_timestamp = float("inf")
 
             # Find earliest event with proposition
             for proc_id, event in current_frontier.events:
-                if event.has_prop(prop_name):
-                    timestamp = event.vc.clock_dict.get(proc_id, 0)
+                if event.props_mask & prop_mask:
+                    timestamp = event.vc.timestamp(proc_id)
                     if timestamp < min_timestamp:
                         min_timestamp = timestamp
                         target_event = event
@@ -572,14 +1191,14 @@ class PBTLMonitor:
             Minimal satisfying frontier
         """
         if isinstance(n_block.operand, Literal):
-            prop_name = n_block.operand.name
+            prop_mask = prop_bit(n_block.operand.name)
             target_event = None
             min_timestamp = float("inf")
 
             # Find earliest event with proposition
             for proc_id, event in current_frontier.events:
-                if event.has_prop(prop_name):
-                    timestamp = event.vc.clock_dict.get(proc_id, 0)
+                if event.props_mask & prop_mask:
+                    timestamp = event.vc.timestamp(proc_id)
                     if timestamp < min_timestamp:
                         min_timestamp = timestamp
                         target_event = event
@@ -595,28 +1214,18 @@ class PBTLMonitor:
     def _apply_case_logic(self, disjunct: EPDisjunct, frontier: Frontier) -> None:
         """Apply case-specific logic from Table 1.
 
+        The handler is looked up from the disjunct's case in one table access
+        rather than by comparing the case against each row of Table 1.
+
         Args:
             disjunct: Disjunct to evaluate
             frontier: Current frontier
         """
-        case = disjunct.case_type()
-
-        if case == "P":
-            self._handle_p_only(disjunct)
-        elif case == "P+M":
-            self._handle_pm_case(disjunct, frontier)
-        elif case == "P+M+N":
-            self._handle_pmn_case(disjunct, frontier)
-        elif case == "P+N":
-            self._handle_pn_case(disjunct)
-        elif case == "M+N":
-            self._handle_mn_case(disjunct, frontier)
-        elif case == "N":
-            self._handle_n_only(disjunct)
-        elif case == "M":
-            self._handle_m_only(disjunct, frontier)
-
-    def _handle_p_only(self, disjunct: EPDisjunct) -> None:
+        handler = self._CASE_HANDLERS.get(disjunct.case)
+        if handler is not None:
+            handler(self, disjunct, frontier)
+
+    def _handle_p_only(self, disjunct: EPDisjunct, frontier: Frontier) -> None:
         """Handle Case 1: P only."""
         if all(
             disjunct.p_satisfied_at.get(i) is not None
@@ -627,7 +1236,7 @@ class PBTLMonitor:
                 disjunct.p_satisfied_at[i] for i in range(len(disjunct.p_blocks))
             ]
             disjunct.success_frontier = max(
-                p_frontiers, key=lambda f: sum(f.vc.clock_dict.values())
+                p_frontiers, key=lambda f: sum(ts for _, ts in f.vc.clock)
             )
 
     def _handle_pm_case(self, disjunct: EPDisjunct, frontier: Frontier) -> None:
@@ -667,7 +1276,7 @@ class PBTLMonitor:
             for i in range(len(disjunct.n_blocks)):
                 n_frontier = disjunct.n_satisfied_at.get(i)
                 if n_frontier is not None:
-                    if len(self.all_processes) == 1 and n_frontier <= frontier:
+                    if self.single_process and n_frontier <= frontier:
                         logger.early_violation(
                             "P+M+N", "N ≤ current frontier in single-process case"
                         )
@@ -699,7 +1308,7 @@ class PBTLMonitor:
                 disjunct.verdict = Verdict.FALSE
                 logger.case_failure("P+M+N", "N constraint violation")
 
-    def _handle_pn_case(self, disjunct: EPDisjunct) -> None:
+    def _handle_pn_case(self, disjunct: EPDisjunct, frontier: Frontier) -> None:
         """Handle Case 4: P+N with N-constraint checking."""
         logger = get_logger()
         all_p_satisfied = all(
@@ -708,7 +1317,7 @@ class PBTLMonitor:
         )
 
         # Early violation detection for single-process systems
-        if not all_p_satisfied and len(self.all_processes) == 1:
+        if not all_p_satisfied and self.single_process:
             for i in range(len(disjunct.n_blocks)):
                 if disjunct.n_satisfied_at.get(i) is not None:
                     logger.early_violation(
@@ -763,7 +1372,7 @@ class PBTLMonitor:
             else:
                 disjunct.verdict = Verdict.FALSE
 
-    def _handle_n_only(self, disjunct: EPDisjunct) -> None:
+    def _handle_n_only(self, disjunct: EPDisjunct, frontier: Frontier) -> None:
         """Handle Case 6: N only."""
         for i in range(len(disjunct.n_blocks)):
             if disjunct.n_satisfied_at.get(i) is not None:
@@ -779,6 +1388,17 @@ class PBTLMonitor:
             disjunct.verdict = Verdict.TRUE
             disjunct.success_frontier = frontier
 
+    # Table 1 case of a disjunct mapped to the handler applying its logic
+    _CASE_HANDLERS = {
+        "P": _handle_p_only,
+        "P+M": _handle_pm_case,
+        "P+M+N": _handle_pmn_case,
+        "P+N": _handle_pn_case,
+        "M+N": _handle_mn_case,
+        "N": _handle_n_only,
+        "M": _handle_m_only,
+    }
+
     def _create_m_satisfaction_frontier(
         self, disjunct: EPDisjunct, current_frontier: Frontier
     ) -> Frontier:
@@ -823,17 +1443,13 @@ class PBTLMonitor:
             True if event is needed for M-satisfaction
         """
         # Direct M-literal satisfaction
-        for m_literal in disjunct.m_literals:
-            if _holds(m_literal, Frontier({list(event.processes)[0]: event})):
-                return True
+        if disjunct.any_m_literal_holds(event.props_mask):
+            return True
 
         # Causal dependency check
         for proc, other_event in current_frontier.events:
             if other_event != event:
-                other_satisfies_m = any(
-                    _holds(m_lit, Frontier({proc: other_event}))
-                    for m_lit in disjunct.m_literals
-                )
+                other_satisfies_m = disjunct.any_m_literal_holds(other_event.props_mask)
                 if other_satisfies_m and event.vc <= other_event.vc:
                     if any(
                         proc_id in event.processes for proc_id in other_event.processes
@@ -852,10 +1468,7 @@ class PBTLMonitor:
         Returns:
             True if event satisfies an N-block
         """
-        for n_block in disjunct.n_blocks:
-            if _holds(n_block, Frontier({list(event.processes)[0]: event})):
-                return True
-        return False
+        return disjunct.any_n_block_holds(event.props_mask)
 
     def _find_alternative_event_for_m(
         self, proc: str, current_event: Event, disjunct: EPDisjunct
@@ -871,7 +1484,7 @@ class PBTLMonitor:
             Alternative event or current event if none found
         """
         if self.initial_frontier:
-            initial_event = self.initial_frontier.events_dict.get(proc)
+            initial_event = self.initial_frontier.event_for(proc)
             if initial_event and not self._event_satisfies_n_block(
                 initial_event, disjunct
             ):
@@ -895,28 +1508,16 @@ class PBTLMonitor:
         if len(frontiers) == 1:
             return frontiers[0]
 
-        # Collect all processes
-        all_processes = set()
+        # Single pass keeping the latest event per process; on equal
+        # timestamps the event from the earliest frontier is kept
+        lub_events: Dict[str, Event] = {}
+        lub_timestamps: Dict[str, int] = {}
         for frontier in frontiers:
-            all_processes.update(proc for proc, _ in frontier.events)
-
-        # Find maximum timestamp event per process
-        lub_events = {}
-        for proc in all_processes:
-            max_event = None
-            max_ts = -1
-
-            for frontier in frontiers:
-                frontier_dict = frontier.events_dict
-                if proc in frontier_dict:
-                    event = frontier_dict[proc]
-                    event_ts = event.vc.clock_dict.get(proc, 0)
-                    if event_ts > max_ts:
-                        max_ts = event_ts
-                        max_event = event
-
-            if max_event:
-                lub_events[proc] = max_event
+            for proc, event in frontier.events:
+                event_ts = event.vc.timestamp(proc)
+                if event_ts > lub_timestamps.get(proc, -1):
+                    lub_timestamps[proc] = event_ts
+                    lub_events[proc] = event
 
         return Frontier(lub_events)
 
@@ -928,7 +1529,7 @@ class PBTLMonitor:
         """
         logger = get_logger()
         disjunct.m_search_active = True
-        logger.debug(f"Initialized M-search for {disjunct.case_type()} case")
+        logger.debug(f"Initialized M-search for {disjunct.case} case")
 
         # Initialize M-vector with current latest events
         for proc in self.all_processes:
@@ -941,7 +1542,7 @@ class PBTLMonitor:
                 ]
                 if events_for_proc:
                     disjunct.m_vector[proc] = max(
-                        events_for_proc, key=lambda e: e.vc.clock_dict.get(proc, 0)
+                        events_for_proc, key=lambda e: e.vc.timestamp(proc)
                     )
 
     def _update_m_vector(self, disjunct: EPDisjunct, event: Event) -> None:
@@ -964,7 +1565,13 @@ class PBTLMonitor:
         Returns:
             True if all M-literals are satisfied
         """
-        return all(_holds(m_literal, frontier) for m_literal in disjunct.m_literals)
+        if disjunct.m_masks is not None:
+            required, forbidden = disjunct.m_masks
+            props_mask = frontier.props_mask
+            return props_mask & required == required and not props_mask & forbidden
+
+        props_mask = frontier.props_mask
+        return all(guard(props_mask) for guard in disjunct.m_guards)
 
     def _update_global_verdict(self) -> None:
         """Update global verdict based on disjunct verdicts."""
@@ -980,33 +1587,26 @@ class PBTLMonitor:
     def finalize(self) -> Verdict:
         """Finalize monitoring by setting remaining UNKNOWN verdicts to FALSE.
 
+        Finalizing leaves every disjunct conclusive, so calling this again
+        returns the settled verdict without revisiting the disjuncts.
+
         Returns:
             Final global verdict
         """
+        if self.finalized:
+            return self.global_verdict
+
         logger = get_logger()
         logger.debug("Finalizing monitoring session")
 
+        # No further frontiers can arrive, so every UNKNOWN disjunct becomes
+        # FALSE whatever its case; the frontiers need not be re-evaluated
         for disjunct in self.disjuncts:
             if disjunct.verdict == Verdict.UNKNOWN:
-                case_type = disjunct.case_type()
-
-                # Special handling for M-cases
-                if (
-                    case_type in ("P+M", "P+M+N", "M", "M+N")
-                    and disjunct.m_search_active
-                ):
-                    m_ever_satisfied = any(
-                        self._check_m_satisfaction(disjunct, f)
-                        for f in self.current_frontiers
-                    )
-                    if not m_ever_satisfied:
-                        disjunct.verdict = Verdict.FALSE
-                        continue
-
-                # Default: UNKNOWN becomes FALSE
                 disjunct.verdict = Verdict.FALSE
 
         self._update_global_verdict()
+        self.finalized = True
         logger.debug(f"Final verdict: {self.global_verdict}")
         return self.global_verdict
 
@@ -18,6 +18,7 @@ particularly for distributed systems with partial order semantics.
 Core Functions:
     parse: Converts formula strings into Abstract Syntax Trees
     parse_and_dlnf: Complete parsing and DLNF transformation pipeline
+    parse_dlnf_disjuncts: Same pipeline, returning the top-level disjuncts
 
 Supported Logic:
     - Past-Based Temporal Logic (PBTL) operators
@@ -133,7 +134,33 @@ def parse_and_dlnf(source: str):
     return dlnf_result
 
 
-__all__ = ["parse", "parse_and_dlnf", "ParseError"]
+def parse_dlnf_disjuncts(source: str):
+    """Parse formula string and return the disjuncts of its DLNF.
+
+    Runs the same pipeline as ``parse_and_dlnf`` but stops before joining the
+    top-level terms into an Or chain. For a well-formed PBTL property every
+    term is an EP node, one per disjunct monitored independently.
+
+    Args:
+        source: Well-formed PBTL formula string to parse and transform
+
+    Returns:
+        Tuple of top-level DLNF terms in disjunction order
+
+    Raises:
+        ParseError: Formula parsing or transformation fails
+
+    Example:
+        >>> parse_dlnf_disjuncts("EP(p | q)")
+        >>> # Returns (EP(p), EP(q))
+    """
+    logger = get_logger()
+    logger.debug(f"Parsing formula into DLNF disjuncts: {source}")
+
+    return DLNFTransformer().transform_terms(parse(source))
+
+
+__all__ = ["parse", "parse_and_dlnf", "parse_dlnf_disjuncts", "ParseError"]
 
 __version__ = "1.0.0"
 __author__ = "Moran Omer"
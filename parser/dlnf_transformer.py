@@ -51,6 +51,25 @@ class DLNFTransformer(ast.Visitor):
             Transformed AST in DLNF
         """
         logger = get_logger()
+        result = _build_or(list(self.transform_terms(root)))
+
+        logger.debug(f"DLNF transformation complete: {type(result).__name__}")
+        return result
+
+    def transform_terms(self, root: ast.Expr) -> Tuple[ast.Expr, ...]:
+        """Transform the AST into DLNF and return its top-level disjuncts.
+
+        Gives the terms that ``transform`` joins with Or, in the same order,
+        so callers that need the disjuncts do not have to take the Or chain
+        apart again.
+
+        Args:
+            root: Root node of the AST to transform
+
+        Returns:
+            Top-level DLNF terms; a single 'false' literal if there are none
+        """
+        logger = get_logger()
         logger.debug(f"Starting DLNF transformation of {type(root).__name__}")
 
         self._memo.clear()
@@ -61,12 +80,8 @@ class DLNFTransformer(ast.Visitor):
         # Phase 2: Ensure top-level DNF structure
         clauses = _to_dnf(visited_ast)
         if not clauses:
-            result = ast.Literal("false")
-        else:
-            result = _build_or([_build_and(clause) for clause in clauses])
-
-        logger.debug(f"DLNF transformation complete: {type(result).__name__}")
-        return result
+            return (ast.Literal("false"),)
+        return tuple(_build_and(clause) for clause in clauses)
 
     def _visit(self, node: ast.Expr) -> ast.Expr:
         """Visit AST node with memoization.
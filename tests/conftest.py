@@ -56,6 +56,21 @@ def setup_test_environment():
     pass
 
 
+@pytest.fixture
+def log_level():
+    """Provide a setter for the monitor log level, restored after the test.
+
+    Yields:
+        Callable[[LogLevel], None]: Sets the level of the shared monitor logger
+    """
+    from utils.logger import LogLevel, get_logger
+
+    logger = get_logger()
+    previous = LogLevel(logger.logger.level)
+    yield logger.set_level
+    logger.set_level(previous)
+
+
 @pytest.fixture
 def sample_processes():
     """Provide standard process set for testing.
@@ -84,3 +99,45 @@ def complex_formula():
         str: Complex PBTL formula for comprehensive tests
     """
     return "EP(EP(p) & EP(q) & !EP(r))"
+
+
+@pytest.fixture(scope="session")
+def example2_trace():
+    """Provide the paper's Example 2 trace, parsed once per session.
+
+    Events are immutable, so every test can share the same parsed objects.
+
+    Returns:
+        Tuple[List[str], List[Event]]: System processes and events in trace order
+    """
+    from utils.trace_reader import get_system_processes, read_trace
+
+    trace_path = Path(__file__).parent / "fixtures" / "example2.csv"
+    return get_system_processes(str(trace_path)), list(read_trace(str(trace_path)))
+
+
+@pytest.fixture(scope="module")
+def monitor_factory():
+    """Provide fresh monitors built from per-module templates.
+
+    The first request for a formula and process list builds and initializes a
+    template monitor; every call returns an independent clone of it, so tests
+    that share a formula skip repeated setup without sharing state.
+
+    Returns:
+        Callable[[str, Optional[List[str]]], PBTLMonitor]: Monitor factory
+    """
+    from core.monitor import PBTLMonitor
+
+    templates = {}
+
+    def make(formula, processes=None):
+        key = (formula, tuple(processes) if processes is not None else None)
+        if key not in templates:
+            monitor = PBTLMonitor(formula)
+            if processes is not None:
+                monitor.initialize_from_trace_processes(processes)
+            templates[key] = monitor
+        return templates[key].clone()
+
+    return make
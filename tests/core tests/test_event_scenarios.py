@@ -4,7 +4,8 @@
 # Tests for Event model - creation, properties, and causal ordering
 
 import pytest
-from core.event import Event, VectorClock
+from core.event import Event, VectorClock, prop_bit
+from tests.helpers import run_with_unpickled
 
 
 def create_event(
@@ -52,6 +53,18 @@ class TestEventBasicProperties:
         assert event.props == frozenset()
         assert event.has_prop("anything") is False
 
+    def test_props_mask_matches_props(self):
+        """Test proposition bitmask agrees with the proposition set."""
+        event = create_event("e1", {"P"}, {"P": 1}, {"p", "q"})
+        empty = create_event("e2", {"P"}, {"P": 2}, set())
+
+        assert event.props_mask == prop_bit("p") | prop_bit("q")
+        assert event.props_mask & prop_bit("p")
+        assert not event.props_mask & prop_bit("not_present")
+        assert empty.props_mask == 0
+        assert prop_bit("p") != prop_bit("q")
+        assert prop_bit("p") == prop_bit("p")
+
     def test_event_equality_and_hashing(self):
         """Test event equality and hash consistency."""
         event1 = create_event("e1", {"P"}, {"P": 1}, {"prop"})
@@ -239,3 +252,61 @@ class TestEventComplexScenarios:
         assert event != None
         assert event != {"eid": "e1"}
         assert event != ["e1", "P", 1]
+
+    def test_cached_masks_do_not_affect_identity(self):
+        """Test that slot-cached derived values are ignored by eq and hash."""
+        cached = create_event("e1", {"P"}, {"P": 1, "Q": 0}, {"prop"})
+        fresh = create_event("e1", {"P"}, {"P": 1, "Q": 0}, {"prop"})
+        cached.props_mask
+        cached.vc.timestamp("P")
+
+        assert not hasattr(cached, "__dict__")
+        assert cached == fresh and hash(cached) == hash(fresh)
+        assert cached.vc == fresh.vc and hash(cached.vc) == hash(fresh.vc)
+
+    def test_event_hash_stable_across_calls(self):
+        """Test that repeated hashing agrees with the hash of the event fields."""
+        event = create_event("e1", {"P"}, {"P": 1}, {"prop"})
+        expected = hash((event.eid, event.processes, event.vc, event.props))
+
+        assert hash(event) == expected
+        assert hash(event) == expected
+        assert {event: "seen"}[create_event("e1", {"P"}, {"P": 1}, {"prop"})]
+
+    def test_event_equality_with_cached_hashes(self):
+        """Test equality before and after hashes are cached, and across types."""
+        event = create_event("e1", {"P"}, {"P": 1}, {"prop"})
+        same = create_event("e1", {"P"}, {"P": 1}, {"prop"})
+        other = create_event("e1", {"P"}, {"P": 2}, {"prop"})
+
+        assert event == same and event != other
+        hash(event), hash(same), hash(other)
+        assert event == same and event != other
+        assert event.__eq__("e1") is NotImplemented
+        assert event != "e1" and event != None
+
+    def test_unpickled_event_recomputes_mask_and_hash(self):
+        """Test that an event loaded in another process drops its cached values."""
+        prop_bit("only_in_parent")
+        event = create_event("e1", {"P"}, {"P": 1}, {"p"})
+        hash(event), event.props_mask
+
+        output = run_with_unpickled(
+            event,
+            """
+from core.event import Event, VectorClock, prop_bit
+from core.monitor import PBTLMonitor
+from utils.logger import LogLevel, set_log_level
+
+set_log_level(LogLevel.WARNING)
+for i in range(64):
+    prop_bit(f"only_in_child_{i}")
+same = Event("e1", frozenset({"P"}), VectorClock({"P": 1}), frozenset({"p"}))
+monitor = PBTLMonitor("EP(p)")
+monitor.process_event(obj)
+print(obj == same, obj in {same}, obj.props_mask == prop_bit("p"))
+print(monitor.global_verdict.name)
+""",
+        )
+
+        assert output.splitlines() == ["True True True", "TRUE"]
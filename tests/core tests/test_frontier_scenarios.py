@@ -20,6 +20,7 @@ proper evaluation of temporal properties in distributed system monitoring.
 import pytest
 from core.event import Event, VectorClock
 from core.frontier import Frontier
+from tests.helpers import run_with_unpickled
 
 
 def create_event(
@@ -80,6 +81,10 @@ class TestFrontierBasicOperations:
         expected_vc = VectorClock({"P": 3, "Q": 4})
         assert frontier.vc == expected_vc
 
+        # Computed once and reused by later comparisons
+        assert frontier.vc is frontier.vc
+        assert frontier == Frontier({"P": event_p, "Q": event_q})
+
     def test_frontier_vector_clock_with_additional_processes(self):
         """Test frontier VC computation when events reference external processes."""
         # P knows about R:5
@@ -105,6 +110,27 @@ class TestFrontierBasicOperations:
         assert frontier.has_prop("shared") is True
         assert frontier.has_prop("not_present") is False
 
+        assert frontier.props_mask == event_p.props_mask | event_q.props_mask
+        assert Frontier({}).props_mask == 0
+
+    def test_event_for_looks_up_single_process(self):
+        """Test per-process event lookup without building a dictionary."""
+        event_p = create_event("ep", {"P"}, {"P": 1}, set())
+        event_q = create_event("eq", {"Q"}, {"Q": 1}, set())
+        frontier = Frontier({"Q": event_q, "P": event_p})
+
+        assert frontier.event_for("P") == event_p
+        assert frontier.event_for("Q") == event_q
+        assert frontier.event_for("R") is None
+        assert Frontier({}).event_for("P") is None
+
+        # Frontiers with the same processes resolve through the same layout
+        extended = frontier.extend_with_event(
+            create_event("ep2", {"P"}, {"P": 2}, set())
+        )
+        assert extended.event_for("P").eid == "ep2"
+        assert extended.event_for("Q") == event_q
+
     def test_frontier_extend_with_event_single_process(self):
         """Test extending frontier with event for existing process."""
         initial_event = create_event("e1", {"P"}, {"P": 1}, {"initial"})
@@ -132,6 +158,26 @@ class TestFrontierBasicOperations:
         assert frontier2.events_dict["Q"] == joint_event
         assert frontier2.has_prop("synced")
 
+        # Same value and hash as a frontier built from scratch
+        rebuilt = Frontier({"Q": joint_event, "P": joint_event})
+        assert frontier2 == rebuilt
+        assert hash(frontier2) == hash(rebuilt)
+
+    def test_frontier_extend_keeps_untouched_entries(self):
+        """Test that extending only replaces the event's own processes."""
+        event_p = create_event("ep", {"P"}, {"P": 1}, set())
+        event_q = create_event("eq", {"Q"}, {"Q": 1}, set())
+        event_r = create_event("er", {"R"}, {"R": 1}, set())
+        frontier1 = Frontier({"P": event_p, "Q": event_q, "R": event_r})
+
+        new_q = create_event("eq2", {"Q"}, {"Q": 2}, {"q_done"})
+        frontier2 = frontier1.extend_with_event(new_q)
+
+        assert [proc for proc, _ in frontier2.events] == ["P", "Q", "R"]
+        assert frontier2.events[0] is frontier1.events[0]
+        assert frontier2.events[2] is frontier1.events[2]
+        assert frontier2.events_dict["Q"] == new_q
+
     def test_frontier_extend_adding_new_process(self):
         """Test extending frontier by adding event for new process."""
         event_p = create_event("ep", {"P"}, {"P": 1}, set())
@@ -205,6 +251,55 @@ class TestFrontierComparison:
         assert frontier1 == frontier3  # Order shouldn't matter
         assert hash(frontier1) == hash(frontier2)
 
+    def test_cached_frontier_values_do_not_affect_identity(self):
+        """Test that slot-cached derived values are ignored by eq and hash."""
+        event_p = create_event("ep", {"P"}, {"P": 1}, {"prop"})
+        cached = Frontier({"P": event_p})
+        fresh = Frontier({"P": event_p})
+        cached.vc, cached.props_mask, cached.event_for("P")
+
+        assert not hasattr(cached, "__dict__")
+        assert cached == fresh and hash(cached) == hash(fresh)
+        assert cached.extend_with_event(event_p) == fresh
+
+    def test_frontier_hash_stable_across_calls(self):
+        """Test that repeated hashing agrees with the hash of the frontier events."""
+        event_p = create_event("ep", {"P"}, {"P": 1}, {"prop"})
+        frontier = Frontier({"P": event_p})
+
+        assert hash(frontier) == hash(frontier.events)
+        assert hash(frontier) == hash(frontier.events)
+
+        event_q = create_event("eq", {"Q"}, {"Q": 1}, set())
+        extended = frontier.extend_with_event(event_q)
+        assert hash(extended) == hash(Frontier({"P": event_p, "Q": event_q}))
+        assert hash(extended) == hash(extended.events)
+
+    def test_unpickled_frontier_recomputes_mask_and_hash(self):
+        """Test that a frontier loaded in another process drops its cached values."""
+        frontier = Frontier({"P": create_event("ep", {"P"}, {"P": 1}, {"p"})})
+        hash(frontier), frontier.props_mask, frontier.vc
+        empty = Frontier({})
+        hash(empty), empty.props_mask
+
+        output = run_with_unpickled(
+            (frontier, empty),
+            """
+from core.event import Event, VectorClock, prop_bit
+from core.frontier import Frontier
+
+for i in range(64):
+    prop_bit(f"only_in_child_{i}")
+frontier, empty = obj
+event = Event("ep", frozenset({"P"}), VectorClock({"P": 1}), frozenset({"p"}))
+same = Frontier({"P": event})
+print(frontier == same, frontier in {same}, frontier.props_mask == prop_bit("p"))
+print(empty in {Frontier({})}, empty.props_mask == 0)
+""",
+        )
+
+        assert output.splitlines() == ["True True True", "True True"]
+
     def test_frontier_reflexive_comparison(self):
         """Test reflexive properties of frontier comparison."""
         frontier = Frontier({"P": create_event("e1", {"P"}, {"P": 1}, set())})
@@ -0,0 +1,94 @@
+# tests/core_tests/test_monitor_helpers_scenarios.py
+# This file is part of Kairos - A PBTL Runtime Verification
+#
+# White-box tests for the module-level helpers of the monitor
+
+"""Test suite for the private helpers the monitor is built from.
+
+This module tests, directly, the pieces of core.monitor whose effect on
+verdicts is hard to observe in isolation:
+- Guards compiled from expressions to proposition bitmask predicates
+- Stable causal ordering of event batches
+
+End-to-end monitor behaviour is covered by the integration tests.
+"""
+
+import pytest
+from core.event import Event, VectorClock
+from core.monitor import _compile_guard, _stable_causal_order
+from parser import parse
+
+
+def create_event(
+    eid: str, procs: set[str], clock: dict[str, int], props: set[str]
+) -> Event:
+    """Factory function for creating Event objects in tests.
+
+    Args:
+        eid: Event identifier
+        procs: Set of participating process names
+        clock: Vector clock mapping process names to timestamps
+        props: Set of propositions that hold after event execution
+
+    Returns:
+        Event: Configured event instance for testing
+    """
+    return Event(eid, frozenset(procs), VectorClock(clock), frozenset(props))
+
+
+class TestCompiledGuards:
+    """Test guards compiled from expressions."""
+
+    @pytest.mark.parametrize(
+        "formula, truth_table",
+        [
+            ("a & !(b | false)", [False, True, False, False]),
+            ("EP(EP(a & !EP(b)) & !(a & b)) | (true & !b)", [True, True, False, False]),
+            ("!(a | b) & (false | EP(a) | true)", [True, False, False, False]),
+        ],
+    )
+    def test_guard_truth_table(self, formula, truth_table):
+        """Test compiled guards for every valuation of a and b, EP being transparent."""
+        guard = _compile_guard(parse(formula))
+        valuations = [set(), {"a"}, {"b"}, {"a", "b"}]
+
+        for props, expected in zip(valuations, truth_table):
+            mask = create_event("e", {"P"}, {"P": 1}, props).props_mask
+            assert guard(mask) == expected, props
+
+
+class TestStableCausalOrder:
+    """Test causal ordering of event batches."""
+
+    @pytest.mark.parametrize(
+        "batch, expected",
+        [
+            # Concurrent events keep their batch order, whatever their clocks
+            (["q1", "q2", "p1"], ["q1", "q2", "p1"]),
+            # An event only moves behind the events it depends on
+            (["p2", "q1", "p1"], ["q1", "p1", "p2"]),
+            (["r1", "p2", "q1", "p1"], ["r1", "q1", "p1", "p2"]),
+        ],
+    )
+    def test_batch_reordered_only_as_far_as_causality_requires(self, batch, expected):
+        """Test that batches are reordered only as far as causality requires."""
+        events = {
+            "p1": create_event("p1", {"P"}, {"P": 1, "Q": 0}, set()),
+            "p2": create_event("p2", {"P"}, {"P": 2, "Q": 1}, set()),
+            "q1": create_event("q1", {"Q"}, {"P": 0, "Q": 1}, set()),
+            "q2": create_event("q2", {"Q"}, {"P": 0, "Q": 2}, set()),
+            "r1": create_event("r1", {"R"}, {"R": 1}, set()),
+        }
+
+        ordered = _stable_causal_order([events[eid] for eid in batch])
+        assert [event.eid for event in ordered] == expected
+
+    def test_reversed_chain_restored(self):
+        """Test that a reversed causal chain is put back in causal order."""
+        events = [
+            create_event("first_ev", {"P"}, {"P": 1, "Q": 0}, {"first"}),
+            create_event("second_ev", {"Q"}, {"P": 1, "Q": 1}, {"second"}),
+            create_event("done_ev", {"P"}, {"P": 2, "Q": 1}, {"done"}),
+        ]
+
+        assert _stable_causal_order(events[::-1]) == events
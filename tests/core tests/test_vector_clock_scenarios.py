@@ -255,3 +255,150 @@ class TestVectorClockCausalOrdering:
         assert vc != [("P", 1)]
         assert vc != 42
         assert vc != None
+
+    def test_from_row_positional_construction(self):
+        """Test building vector clocks from positional rows of timestamps."""
+        processes = ["S1", "J1", "PO"]
+
+        vc = VectorClock.from_row((4, 0, 3), processes)
+
+        assert vc == VectorClock({"S1": 4, "J1": 0, "PO": 3})
+        assert VectorClock.from_row((4, 1, 3), processes) > vc
+
+        with pytest.raises(ValueError):
+            VectorClock.from_row((1, 2), processes)
+
+    def test_comparison_with_disjoint_and_interleaved_processes(self):
+        """Test ordering when clocks name different, interleaved process sets."""
+        vc_ac = VectorClock({"A": 1, "C": 2})
+        vc_abcd = VectorClock({"A": 1, "B": 5, "C": 2, "D": 1})
+        vc_bd = VectorClock({"B": 1, "D": 1})
+        vc_zero = VectorClock({"Z": 0})
+
+        assert vc_ac <= vc_abcd
+        assert not (vc_abcd <= vc_ac)
+        assert vc_bd <= vc_abcd
+        assert not (vc_ac <= vc_bd)
+        # Explicit zero entries impose no constraint on the other clock
+        assert vc_zero <= vc_ac
+        assert vc_zero <= VectorClock({})
+
+    def test_from_delta_applies_changed_components(self):
+        """Test deriving a clock from its predecessor plus changed entries."""
+        parent = VectorClock({"PA": 1, "PB": 0})
+
+        child = VectorClock.from_delta(parent, {"PA": 2})
+        joined = VectorClock.from_delta(child, {"PC": 1})
+
+        assert child == VectorClock({"PA": 2, "PB": 0})
+        assert joined == VectorClock({"PA": 2, "PB": 0, "PC": 1})
+        assert parent < child < joined
+        assert VectorClock.from_delta(parent, {}) is parent
+
+    def test_packed_comparison_matches_componentwise_order(self):
+        """Test that packed same-layout comparison agrees with the definition."""
+        processes = ["S1", "J1", "J2", "MS", "S2", "PO"]
+        rows = [
+            (0, 0, 0, 0, 0, 0),
+            (1, 0, 0, 0, 0, 0),
+            (4, 4, 4, 0, 3, 6),
+            (4, 4, 4, 4, 3, 7),
+            (13, 6, 6, 9, 10, 22),
+            (0, 7, 0, 0, 0, 0),
+        ]
+        clocks = [VectorClock.from_row(row, processes) for row in rows]
+
+        for row_a, vc_a in zip(rows, clocks):
+            for row_b, vc_b in zip(rows, clocks):
+                expected = all(a <= b for a, b in zip(row_a, row_b))
+                assert (vc_a <= vc_b) == expected
+                assert (vc_a < vc_b) == (expected and row_a != row_b)
+
+    def test_comparison_with_separately_built_process_names(self):
+        """Test clocks whose equal process names are distinct string objects."""
+        names = ["".join(["P", str(i)]) for i in range(3)]
+        other_names = ["".join(["P", str(i)]) for i in range(3)]
+        assert names[0] is not other_names[0]
+
+        early = VectorClock.from_row([1, 0, 2], names)
+        late = VectorClock.from_row([1, 3, 2], other_names)
+
+        assert early <= late
+        assert early < late
+        assert not (late <= early)
+
+    def test_comparison_with_timestamps_beyond_packed_range(self):
+        """Test that very large timestamps still compare correctly."""
+        small = VectorClock({"P": 2**31 - 1, "Q": 5})
+        huge = VectorClock({"P": 2**40, "Q": 5})
+
+        assert small <= huge
+        assert not (huge <= small)
+        assert small < huge
+
+    def test_join_is_componentwise_maximum(self):
+        """Test least upper bound of clocks with shared and differing layouts."""
+        a = VectorClock({"P": 3, "Q": 1})
+        b = VectorClock({"P": 1, "Q": 4})
+        c = VectorClock({"Q": 2, "R": 5})
+
+        assert VectorClock.join([a, b]) == VectorClock({"P": 3, "Q": 4})
+        assert VectorClock.join([a, b, c]) == VectorClock({"P": 3, "Q": 4, "R": 5})
+        assert VectorClock.join([a]) == a
+        assert VectorClock.join([]) == VectorClock({})
+
+        joined = VectorClock.join([a, b])
+        assert a <= joined and b <= joined
+
+    def test_join_clamps_negative_timestamps_to_zero(self):
+        """Test that the join never records a timestamp below zero."""
+        negative = VectorClock({"P": -2, "Q": -1})
+        mixed = VectorClock({"P": -5, "Q": 3})
+
+        assert VectorClock.join([negative, mixed]) == VectorClock({"P": 0, "Q": 3})
+        assert VectorClock.join([negative, VectorClock({"R": -1})]) == VectorClock(
+            {"P": 0, "Q": 0, "R": 0}
+        )
+
+    def test_interned_clocks_are_shared(self):
+        """Test that interning returns one clock per distinct mapping."""
+        first = VectorClock.intern({"P": 1, "Q": 2})
+        second = VectorClock.intern({"Q": 2, "P": 1})
+
+        assert first is second
+        assert first == VectorClock({"P": 1, "Q": 2})
+        assert VectorClock.intern({"P": 2, "Q": 2}) is not first
+        assert first <= second and not first < second
+
+    def test_clocks_compare_after_shared_caches_turn_over(self):
+        """Test clocks built before and after many other layouts still compare."""
+        before = VectorClock({"P": 1, "Q": 1})
+        assert before <= VectorClock({"P": 1, "Q": 1})
+
+        for i in range(1000):
+            VectorClock.intern({f"X{i}": 1, "P": i}) <= VectorClock({f"X{i}": 2})
+
+        after = VectorClock({"P": 2, "Q": 1})
+        assert before < after and not after <= before
+        assert VectorClock.intern({"P": 1, "Q": 1}) == before
+
+    def test_equality_by_identity_and_entries(self):
+        """Test that equality holds for shared and separately built clocks."""
+        vc = VectorClock({"P": 1, "Q": 2})
+        same = VectorClock({"Q": 2, "P": 1})
+
+        assert vc == vc
+        assert vc == same and hash(vc) == hash(same)
+        assert vc != VectorClock({"P": 1, "Q": 3})
+        assert vc != VectorClock({"P": 1})
+        assert vc != (("P", 1), ("Q", 2))
+        assert len({vc, same, VectorClock.intern({"P": 1, "Q": 2})}) == 1
+
+    def test_timestamp_lookup_defaults_to_zero(self):
+        """Test per-process timestamp lookup without building a dictionary."""
+        vc = VectorClock({"P": 3, "Q": 1})
+
+        assert vc.timestamp("P") == 3
+        assert vc.timestamp("Q") == 1
+        assert vc.timestamp("R") == 0
+        assert VectorClock({}).timestamp("P") == 0
@@ -0,0 +1,54 @@
+# tests/helpers.py
+# This file is part of Kairos - A PBTL Runtime Verification
+#
+# Helpers shared by test modules that build events by hand
+
+"""Helpers shared by test modules that build events by hand."""
+
+import os
+import pickle
+import subprocess
+import sys
+from pathlib import Path
+
+_SHARED_SETS: dict[frozenset[str], frozenset[str]] = {}
+
+
+def shared_set(names: set[str]) -> frozenset[str]:
+    """Return the one frozenset kept for a set of process or proposition names.
+
+    Args:
+        names: Process or proposition names
+
+    Returns:
+        frozenset[str]: Shared frozenset equal to ``names``
+    """
+    key = frozenset(names)
+    return _SHARED_SETS.setdefault(key, key)
+
+
+def run_with_unpickled(obj: object, script: str) -> str:
+    """Run a script in a fresh interpreter on an object pickled by this one.
+
+    The object is pickled here and loaded into the variable ``obj`` before
+    ``script`` runs. String hashing is randomized in the child, so values
+    that depend on the process, such as hashes and proposition bits, differ
+    from the ones computed here.
+
+    Args:
+        obj: Object to pickle
+        script: Python source to run once ``obj`` is loaded
+
+    Returns:
+        str: Standard output of the script, stripped
+    """
+    prelude = "import pickle, sys\nobj = pickle.load(sys.stdin.buffer)\n"
+    result = subprocess.run(
+        [sys.executable, "-c", prelude + script],
+        input=pickle.dumps(obj),
+        capture_output=True,
+        cwd=Path(__file__).parent.parent,
+        env={**os.environ, "PYTHONHASHSEED": "random"},
+        check=True,
+    )
+    return result.stdout.decode().strip()
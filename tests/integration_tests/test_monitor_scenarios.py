@@ -22,8 +22,11 @@ for distributed system runtime verification using PBTL properties.
 
 import pytest
 from core.monitor import PBTLMonitor
-from core.event import Event, VectorClock
+from core.event import Event, VectorClock, prop_bit
 from core.verdict import Verdict
+from parser import parse
+from utils.logger import LogLevel, get_logger
+from tests.helpers import shared_set
 
 
 def create_event(
@@ -31,6 +34,10 @@ def create_event(
 ) -> Event:
     """Factory function for creating Event objects in tests.
 
+    Like events read from a trace file, events that share processes,
+    propositions or a clock share the objects, so their hashes and
+    proposition masks are computed once.
+
     Args:
         eid: Event identifier
         procs: Set of participating process names
@@ -40,7 +47,35 @@ def create_event(
     Returns:
         Event: Configured event instance for testing
     """
-    return Event(eid, frozenset(procs), VectorClock(clock), frozenset(props))
+    return Event(eid, shared_set(procs), VectorClock.intern(clock), shared_set(props))
+
+
+def run_trace(monitor: PBTLMonitor, steps: list[tuple[Event, Verdict]]) -> PBTLMonitor:
+    """Feed events to a monitor, checking the global verdict after each one.
+
+    Args:
+        monitor: Monitor to drive
+        steps: (event, expected global verdict after processing it) pairs
+
+    Returns:
+        PBTLMonitor: The monitor, for further checks
+    """
+    observed = []
+    for event, expected in steps:
+        monitor.process_event(event)
+        observed.append((event.eid, monitor.global_verdict))
+        assert monitor.global_verdict == expected, f"Verdicts so far: {observed}"
+    return monitor
+
+
+# Events shared by several scenarios. Events are immutable and the monitor
+# never modifies the events it processes, so one instance serves every test.
+INIT_P1 = create_event("init_ev", {"P"}, {"P": 1}, {"init"})
+READY_P2 = create_event("ready_ev", {"P"}, {"P": 2}, {"ready"})
+ERROR_P2 = create_event("error_ev", {"P"}, {"P": 2}, {"error"})
+SECOND_P2 = create_event("second_ev", {"P"}, {"P": 2}, {"second"})
+TICK_P1 = create_event("p_tick", {"P"}, {"P": 1}, set())
+TICK_Q1 = create_event("q_tick", {"Q"}, {"Q": 1}, set())
 
 
 class TestMonitorBasicProperties:
@@ -63,30 +98,98 @@ class TestMonitorBasicProperties:
         assert "Q" in monitor.all_processes
         assert "R" in monitor.all_processes
         assert monitor.initial_frontier is not None
+        assert not monitor.single_process
+
+    def test_monitors_over_same_processes_share_initial_frontier(self):
+        """Test that the iota frontier is built once per process set."""
+        first = PBTLMonitor("EP(p)")
+        first.initialize_from_trace_processes(["P", "Q"])
+        second = PBTLMonitor("EP(q)")
+        second.initialize_from_trace_processes(["Q", "P"])
+
+        assert first.initial_frontier is second.initial_frontier
+        assert first.initial_frontier.events_dict["P"].has_prop("iota")
+
+    def test_test_events_share_process_and_proposition_sets(self):
+        """Test that created events reuse one frozenset per distinct set."""
+        first = create_event("a1", {"P"}, {"P": 1}, {"ready", "ok"})
+        second = create_event("a2", {"P"}, {"P": 2}, {"ok", "ready"})
+
+        assert first.processes is second.processes
+        assert first.props is second.props
+
+    def test_single_process_system_detected_at_initialization(self):
+        """Test that single-process systems are recognised by both init paths."""
+        declared = PBTLMonitor("EP(p)")
+        declared.initialize_from_trace_processes(["P"])
+        assert declared.single_process
+
+        discovered = PBTLMonitor("EP(p)")
+        discovered.process_event(TICK_P1)
+        assert discovered.single_process
+
+    @pytest.mark.parametrize(
+        "props, running_verdict, final_verdict",
+        [
+            ({"ready"}, Verdict.TRUE, Verdict.TRUE),
+            ({"other_prop"}, Verdict.UNKNOWN, Verdict.FALSE),
+        ],
+        ids=["success", "failure"],
+    )
+    def test_monitor_simple_m_only(
+        self, monitor_factory, props, running_verdict, final_verdict
+    ):
+        """Test Case 7 (M-only) property satisfaction and failure."""
+        monitor = monitor_factory("EP(ready)")
+        monitor.process_event(create_event("e1", {"P"}, {"P": 1}, props))
+
+        # A missed property stays UNKNOWN until finalized
+        assert monitor.global_verdict == running_verdict
+        assert monitor.finalize() == final_verdict
+
+    def test_minterm_disjunct_satisfied_at_first_matching_frontier(self):
+        """Test that EP over a plain minterm holds once a frontier matches it."""
+        monitor = PBTLMonitor("EP(p & !q)")
+        monitor.initialize_from_trace_processes(["P", "Q"])
 
-    def test_monitor_simple_m_only_success(self):
-        """Test Case 7 (M-only) property satisfaction."""
-        monitor = PBTLMonitor("EP(ready)")
-
-        # Process event that satisfies the property
-        event = create_event("e1", {"P"}, {"P": 1}, {"ready"})
-        monitor.process_event(event)
+        monitor.process_event(create_event("p1", {"P"}, {"P": 1}, {"p", "q"}))
+        assert monitor.global_verdict == Verdict.UNKNOWN
 
+        p2 = create_event("p2", {"P"}, {"P": 2}, {"p"})
+        monitor.process_event(p2)
         assert monitor.global_verdict == Verdict.TRUE
+        assert monitor.disjuncts[0].success_frontier.event_for("P") is p2
 
-    def test_monitor_simple_m_only_failure(self):
-        """Test Case 7 (M-only) property failure."""
-        monitor = PBTLMonitor("EP(target)")
+    def test_minterm_unaffected_by_irrelevant_events(self):
+        """Test that events without a required proposition only move frontiers."""
+        monitor = PBTLMonitor("EP(p & q)")
+        monitor.initialize_from_trace_processes(["P", "Q"])
+        p1 = create_event("p1", {"P"}, {"P": 1, "Q": 0}, {"p"})
+        monitor.process_event(p1)
 
-        # Process event that doesn't satisfy the property
-        event = create_event("e1", {"P"}, {"P": 1}, {"other_prop"})
-        monitor.process_event(event)
+        tick = create_event("tick", {"Q"}, {"P": 0, "Q": 1}, {"other"})
+        monitor.process_event(tick)
+        assert monitor.global_verdict == Verdict.UNKNOWN
+        assert monitor.disjuncts[0].success_frontier is None
+        (frontier,) = monitor.current_frontiers
+        assert frontier.event_for("P") is p1 and frontier.event_for("Q") is tick
 
-        # Should remain UNKNOWN until finalized
+        q2 = create_event("q2", {"Q"}, {"P": 1, "Q": 2}, {"q"})
+        monitor.process_event(q2)
+        assert monitor.global_verdict == Verdict.TRUE
+        success = monitor.disjuncts[0].success_frontier
+        assert success.event_for("P") is p1 and success.event_for("Q") is q2
+
+    def test_negated_minterm_checks_irrelevant_events(self):
+        """Test that dropping a forbidden proposition can satisfy a minterm."""
+        monitor = PBTLMonitor("EP(p & !q)")
+        monitor.initialize_from_trace_processes(["P", "Q"])
+        monitor.process_event(create_event("q1", {"Q"}, {"P": 0, "Q": 1}, {"q"}))
+        monitor.process_event(create_event("p1", {"P"}, {"P": 1, "Q": 0}, {"p"}))
         assert monitor.global_verdict == Verdict.UNKNOWN
 
-        final_verdict = monitor.finalize()
-        assert final_verdict == Verdict.FALSE
+        monitor.process_event(create_event("tick", {"Q"}, {"P": 0, "Q": 2}, set()))
+        assert monitor.global_verdict == Verdict.TRUE
 
     def test_monitor_concurrent_events_success(self):
         """Test property satisfaction with concurrent events."""
@@ -101,53 +204,226 @@ class TestMonitorBasicProperties:
 
         assert monitor.global_verdict == Verdict.TRUE
 
+    def test_monitors_for_same_formula_share_parsed_disjuncts(self):
+        """Test that repeated formulas reuse the parse but not tracking state."""
+        first = PBTLMonitor("EP(EP(init) & ready & !EP(error))")
+        second = PBTLMonitor("EP(EP(init) & ready & !EP(error))")
+
+        # Parsed EP nodes are shared, per-monitor disjunct state is not
+        assert first.disjuncts[0].ep_formula is second.disjuncts[0].ep_formula
+        assert first.disjuncts[0] is not second.disjuncts[0]
+
+        # Blocks are compiled once per EP node
+        assert first.disjuncts[0].block_guards is second.disjuncts[0].block_guards
+        assert first.disjuncts[0].p_blocks is not second.disjuncts[0].p_blocks
+
+        first.process_event(INIT_P1)
+        first.process_event(READY_P2)
+
+        assert first.global_verdict == Verdict.TRUE
+        assert second.global_verdict == Verdict.UNKNOWN
+        assert all(v is None for v in second.disjuncts[0].p_satisfied_at.values())
+
+    def test_monitors_for_same_formula_keep_separate_block_memos(self):
+        """Test that block evaluation memos are never shared between monitors."""
+        formula = "EP(EP(EP(deep)) & !EP(EP(bad)))"
+        first = PBTLMonitor(formula)
+        second = PBTLMonitor(formula)
+        twin = first.clone()
+
+        first.process_event(create_event("d1", {"P"}, {"P": 1}, {"deep"}))
+
+        assert first.global_verdict == Verdict.TRUE
+        assert first.disjuncts[0].block_memo
+        assert second.disjuncts[0].block_memo == {}
+        assert twin.disjuncts[0].block_memo == {}
+        assert PBTLMonitor(formula).disjuncts[0].block_memo == {}
+
+    @pytest.mark.parametrize(
+        "formula, disjunct_count, conjunct_count",
+        [
+            ("EP(a) | EP(a)", 1, 1),
+            ("EP(a | a)", 1, 1),
+            ("EP(EP(x) & EP(x) & a & a & !EP(n) & !EP(n))", 1, 3),
+            ("EP(a) | EP(b) | EP(a)", 2, 1),
+        ],
+    )
+    def test_repeated_disjuncts_and_conjuncts_kept_once(
+        self, formula, disjunct_count, conjunct_count
+    ):
+        """Test that idempotent repetitions are monitored only once."""
+        monitor = PBTLMonitor(formula)
+
+        assert len(monitor.disjuncts) == disjunct_count
+        disjunct = monitor.disjuncts[0]
+        assert (
+            len(disjunct.p_blocks) + len(disjunct.m_literals) + len(disjunct.n_blocks)
+            == conjunct_count
+        )
 
-class TestMonitorTableOneCases:
-    """Test Table 1 cases from the Section 4 algorithm."""
+    def test_clone_tracks_state_independently(self):
+        """Test that a cloned monitor keeps its own delivery and verdict state."""
+        original = PBTLMonitor("EP(EP(init) & ready & !EP(error))")
+        original.initialize_from_trace_processes(["P"])
+        original.process_event(INIT_P1)
 
-    def test_p_and_n_success_case(self):
-        """Test Case 4 (P+N) where P is satisfied and N constraint holds."""
-        monitor = PBTLMonitor("EP(EP(ready) & !EP(error))")
+        twin = original.clone()
+        assert twin.seen_events == original.seen_events
+        assert twin.current_frontiers == original.current_frontiers
 
-        # Event satisfying P-block, N-block not violated
-        ready_event = create_event("ready_ev", {"P"}, {"P": 1}, {"ready"})
-        monitor.process_event(ready_event)
+        twin.process_event(READY_P2)
 
+        assert twin.global_verdict == Verdict.TRUE
+        assert original.global_verdict == Verdict.UNKNOWN
+        assert original.seen_events["P"] == 1
+        assert original.disjuncts[0].verdict == Verdict.UNKNOWN
+
+    def test_reset_allows_reuse_for_another_trace(self):
+        """Test that a reset monitor behaves like a newly built one."""
+        monitor = PBTLMonitor("EP(EP(init) & ready & !EP(error))")
+        monitor.initialize_from_trace_processes(["P"])
+        monitor.process_event(INIT_P1)
+        monitor.process_event(READY_P2)
         assert monitor.global_verdict == Verdict.TRUE
 
-    def test_p_and_n_failure_n_violation(self):
-        """Test Case 4 (P+N) where N-block constraint is violated."""
-        monitor = PBTLMonitor("EP(EP(ready) & !EP(error))")
+        monitor.reset()
 
-        # Error occurs first, violating N-block
-        error_event = create_event("error_ev", {"P"}, {"P": 1}, {"error"})
-        monitor.process_event(error_event)
+        fresh = PBTLMonitor("EP(EP(init) & ready & !EP(error))")
+        assert monitor == fresh
 
+        monitor.initialize_from_trace_processes(["P"])
+        monitor.process_event(INIT_P1)
+        monitor.process_event(create_event("e2", {"P"}, {"P": 2}, {"error"}))
         assert monitor.global_verdict == Verdict.FALSE
 
-    def test_p_and_n_success_with_late_n_violation(self):
-        """Test Case 4 (P+N) where P succeeds before N violation."""
-        monitor = PBTLMonitor("EP(EP(ready) & !EP(error))")
+    def test_reset_forgets_block_evaluations(self):
+        """Test that reset clears the per-trace block memo along with the verdicts."""
+        formula = "EP(EP(EP(deep)) & !EP(EP(bad)))"
+        monitor = PBTLMonitor(formula)
+        monitor.process_event(create_event("d1", {"P"}, {"P": 1}, {"deep"}))
+        assert monitor.disjuncts[0].block_memo
 
-        # Ready occurs first (success)
-        ready_event = create_event("ready_ev", {"P"}, {"P": 1}, {"ready"})
-        monitor.process_event(ready_event)
+        monitor.reset()
+
+        assert monitor.disjuncts[0].block_memo == {}
+        assert monitor == PBTLMonitor(formula)
 
-        assert monitor.global_verdict == Verdict.TRUE
 
-        # Error occurs later but shouldn't change verdict (terminal state)
-        error_event = create_event("error_ev", {"P"}, {"P": 2}, {"error"})
-        monitor.process_event(error_event)
+class TestMonitorTableOneCases:
+    """Test Table 1 cases from the Section 4 algorithm."""
 
+    @pytest.mark.parametrize(
+        "formula, case",
+        [
+            ("EP(EP(p))", "P"),
+            ("EP(EP(p) & m)", "P+M"),
+            ("EP(EP(p) & m & !EP(n))", "P+M+N"),
+            ("EP(EP(p) & !EP(n))", "P+N"),
+            ("EP(m & !EP(n))", "M+N"),
+            ("EP(!EP(n))", "N"),
+            ("EP(m)", "M"),
+        ],
+    )
+    def test_case_is_classified_once_at_construction(self, formula, case):
+        """Test that each disjunct records its Table 1 case when created."""
+        disjunct = PBTLMonitor(formula).disjuncts[0]
+
+        assert disjunct.case == case
+        assert disjunct.case == disjunct.case_type()
+        assert case in PBTLMonitor._CASE_HANDLERS
+
+    def test_m_literals_compiled_to_proposition_masks(self):
+        """Test that plain and negated M-literals are checked as bitmasks."""
+        monitor = PBTLMonitor("EP(a & !b)")
+        disjunct = monitor.disjuncts[0]
+
+        assert disjunct.m_masks == (prop_bit("a"), prop_bit("b"))
+        assert PBTLMonitor("EP(true & a)").disjuncts[0].m_masks is None
+
+        monitor.process_event(create_event("e1", {"P"}, {"P": 1}, {"a", "b"}))
+        assert monitor.global_verdict == Verdict.UNKNOWN
+
+        monitor.process_event(create_event("e2", {"P"}, {"P": 2}, {"a"}))
         assert monitor.global_verdict == Verdict.TRUE
 
-    def test_p_m_n_all_satisfied_success(self):
+    @pytest.mark.parametrize(
+        "props", [set(), {"a"}, {"b"}, {"a", "b"}, {"n"}, {"a", "n"}]
+    )
+    def test_any_literal_checks_match_literal_evaluation(self, props):
+        """Test the mask-based any-literal checks against per-literal results."""
+        mask = create_event("e", {"P"}, {"P": 1}, props).props_mask
+
+        # M-literals a, !b and N-block n
+        disjunct = PBTLMonitor("EP(a & !b & !EP(n))").disjuncts[0]
+        assert disjunct.any_m_literal_holds(mask) == ("a" in props or "b" not in props)
+        assert disjunct.any_n_block_holds(mask) == ("n" in props)
+
+        # M-literals true, !b and N-block n & a
+        disjunct = PBTLMonitor("EP(true & !b & !EP(n & a))").disjuncts[0]
+        assert disjunct.any_m_literal_holds(mask)
+        assert disjunct.any_n_block_holds(mask) == ({"n", "a"} <= props)
+
+    def test_conjunction_blocks_compiled_to_masks(self):
+        """Test that EP blocks over conjunctions of propositions carry their bits."""
+        disjunct = PBTLMonitor(
+            "EP(EP(p) & EP(q & r) & EP(q & !r) & !EP(n & true))"
+        ).disjuncts[0]
+
+        assert disjunct.p_masks == (prop_bit("p"), prop_bit("q") | prop_bit("r"), None)
+        assert disjunct.n_masks == (prop_bit("n"),)
+
+    def test_nested_block_evaluated_once_per_proposition_set(self):
+        """Test that unmasked blocks are memoized per proposition bitmask."""
+        disjunct = PBTLMonitor("EP(EP(EP(deep)) & !EP(EP(bad)))").disjuncts[0]
+        assert disjunct.p_masks == (None,)
+        props_mask = prop_bit("deep")
+
+        assert disjunct.p_block_holds(0, props_mask)
+        assert disjunct.block_memo == {(0, props_mask): True}
+        assert not disjunct.any_n_block_holds(props_mask)
+        assert disjunct.block_memo[(1, 0)] is False
+
+        # Propositions a block does not mention reuse its memo entry
+        assert disjunct.p_block_holds(0, props_mask | prop_bit("unrelated"))
+        assert len(disjunct.block_memo) == 2
+
+    def test_conjunction_block_needs_every_proposition(self, monitor_factory):
+        """Test that a conjunction P-block waits for all of its propositions."""
+        monitor = monitor_factory("EP(EP(q & r))", ["P", "Q"])
+
+        run_trace(
+            monitor,
+            [
+                (create_event("q1", {"P"}, {"P": 1, "Q": 0}, {"q"}), Verdict.UNKNOWN),
+                (create_event("r1", {"Q"}, {"P": 0, "Q": 1}, {"r"}), Verdict.TRUE),
+            ],
+        )
+
+    @pytest.mark.parametrize(
+        "steps",
+        [
+            # P-block satisfied while the N-block has not been violated
+            [(create_event("ready_ev", {"P"}, {"P": 1}, {"ready"}), Verdict.TRUE)],
+            # Error occurs first, violating the N-block
+            [(create_event("error_ev", {"P"}, {"P": 1}, {"error"}), Verdict.FALSE)],
+            # Ready occurs first; the later error cannot change the verdict
+            [
+                (create_event("ready_ev", {"P"}, {"P": 1}, {"ready"}), Verdict.TRUE),
+                (ERROR_P2, Verdict.TRUE),
+            ],
+        ],
+        ids=["success", "n_violation", "late_n_violation"],
+    )
+    def test_p_and_n_case(self, monitor_factory, steps):
+        """Test Case 4 (P+N) verdicts for P and N blocks in either order."""
+        run_trace(monitor_factory("EP(EP(ready) & !EP(error))"), steps)
+
+    def test_p_m_n_all_satisfied_success(self, monitor_factory):
         """Test Case 3 (P+M+N) where all conditions are met."""
-        monitor = PBTLMonitor("EP(EP(init) & ready & !EP(error))")
+        monitor = monitor_factory("EP(EP(init) & ready & !EP(error))")
 
         # P-block satisfied
-        init_event = create_event("init_ev", {"P"}, {"P": 1}, {"init"})
-        monitor.process_event(init_event)
+        monitor.process_event(INIT_P1)
 
         # M-literal satisfied (causally after P)
         ready_event = create_event("ready_ev", {"P"}, {"P": 2}, {"ready"})
@@ -156,27 +432,37 @@ class TestMonitorTableOneCases:
         # N-block not violated
         assert monitor.global_verdict == Verdict.TRUE
 
-    def test_p_m_n_n_violation_failure(self):
+    def test_p_m_n_n_violation_failure(self, monitor_factory):
         """Test Case 3 (P+M+N) where N-block constraint is violated."""
-        monitor = PBTLMonitor("EP(EP(init) & ready & !EP(error))")
+        monitor = monitor_factory("EP(EP(init) & ready & !EP(error))")
 
         # P-block satisfied
-        init_event = create_event("init_ev", {"P"}, {"P": 1}, {"init"})
-        monitor.process_event(init_event)
+        monitor.process_event(INIT_P1)
 
         # N-block violated
-        error_event = create_event("error_ev", {"P"}, {"P": 2}, {"error"})
-        monitor.process_event(error_event)
+        monitor.process_event(ERROR_P2)
 
         assert monitor.global_verdict == Verdict.FALSE
 
+    def test_n_block_witness_recorded_only_for_relevant_events(self, monitor_factory):
+        """Test that N-blocks are only satisfied by events carrying their props."""
+        monitor = monitor_factory("EP(EP(init) & ready & !EP(error))", ["P"])
+        disjunct = monitor.disjuncts[0]
+
+        monitor.process_event(INIT_P1)
+        assert disjunct.n_satisfied_at[0] is None
+        assert monitor.global_verdict == Verdict.UNKNOWN
+
+        monitor.process_event(ERROR_P2)
+        assert disjunct.n_satisfied_at[0].event_for("P") is ERROR_P2
+        assert monitor.global_verdict == Verdict.FALSE
+
     def test_p_m_m_not_satisfied_failure(self):
         """Test Case 2 (P+M) where P is satisfied but M is not."""
         monitor = PBTLMonitor("EP(EP(init) & ready)")
 
         # P-block satisfied
-        init_event = create_event("init_ev", {"P"}, {"P": 1}, {"init"})
-        monitor.process_event(init_event)
+        monitor.process_event(INIT_P1)
 
         # M-literal never satisfied
         other_event = create_event("other_ev", {"P"}, {"P": 2}, {"other"})
@@ -185,30 +471,20 @@ class TestMonitorTableOneCases:
         final_verdict = monitor.finalize()
         assert final_verdict == Verdict.FALSE
 
-    def test_n_only_case_failure(self):
-        """Test Case 6 (N-only) where N-block is satisfied (failure)."""
-        monitor = PBTLMonitor("EP(!EP(forbidden))")
-
-        # Forbidden event occurs
-        forbidden_event = create_event("forbidden_ev", {"P"}, {"P": 1}, {"forbidden"})
-        monitor.process_event(forbidden_event)
-
-        assert monitor.global_verdict == Verdict.FALSE
-
-    def test_n_only_case_success(self):
-        """Test Case 6 (N-only) where N-block is not satisfied (success by default)."""
-        monitor = PBTLMonitor("EP(!EP(forbidden))")
+    @pytest.mark.parametrize(
+        "props, running_verdict",
+        [({"forbidden"}, Verdict.FALSE), ({"allowed"}, Verdict.UNKNOWN)],
+        ids=["n_violation", "no_violation"],
+    )
+    def test_n_only_case(self, monitor_factory, props, running_verdict):
+        """Test Case 6 (N-only) with and without the forbidden proposition."""
+        monitor = monitor_factory("EP(!EP(forbidden))")
+        monitor.process_event(create_event("ev", {"P"}, {"P": 1}, props))
 
-        # Other events occur, but not forbidden
-        other_event = create_event("other_ev", {"P"}, {"P": 1}, {"allowed"})
-        monitor.process_event(other_event)
-
-        # At finalization, N-block was never violated
-        final_verdict = monitor.finalize()
-        # Note: This should actually be FALSE because EP(!EP(forbidden))
-        # requires the negation to hold somewhere in the past, but since
-        # nothing ever made !EP(forbidden) true, the property fails
-        assert final_verdict == Verdict.FALSE
+        assert monitor.global_verdict == running_verdict
+        # Even without a violation the property fails: nothing ever made
+        # !EP(forbidden) hold at a frontier after an event
+        assert monitor.finalize() == Verdict.FALSE
 
 
 class TestMonitorCausalOrdering:
@@ -218,15 +494,236 @@ class TestMonitorCausalOrdering:
         """Test causal delivery with out-of-order event arrival."""
         monitor = PBTLMonitor("EP(EP(first) & EP(second))")
 
-        # Events arrive out of order
-        second_event = create_event("second_ev", {"P"}, {"P": 2}, {"second"})
-        first_event = create_event("first_ev", {"P"}, {"P": 1}, {"first"})
+        # Events arrive out of order: the second is buffered until the first
+        # arrives, then both are delivered in order
+        run_trace(
+            monitor,
+            [
+                (SECOND_P2, Verdict.UNKNOWN),
+                (create_event("first_ev", {"P"}, {"P": 1}, {"first"}), Verdict.TRUE),
+            ],
+        )
+
+    def test_process_rows_builds_events_from_positional_clocks(self):
+        """Test row-based trace ingestion, stopping at a conclusive verdict."""
+        monitor = PBTLMonitor("EP(EP(p_msg) & EP(q_response))", stop_on_verdict=True)
+        processes = ["P", "Q"]
+        monitor.initialize_from_trace_processes(processes)
+
+        rows = iter(
+            [
+                ("p_msg", {"P"}, (1, 0), {"p_msg"}),
+                ("q_resp", {"Q"}, (1, 1), {"q_response"}),
+                ("p_late", {"P"}, (2, 1), set()),
+            ]
+        )
+
+        assert monitor.process_rows(processes, rows) == Verdict.TRUE
+        assert monitor.seen_events == {"P": 1, "Q": 1}
+        # The row after the verdict was left unconsumed
+        assert next(rows)[0] == "p_late"
+
+    def test_disjuncts_updated_after_global_verdict_is_final(self):
+        """Test that later disjuncts keep their own verdicts after a final one."""
+        monitor = PBTLMonitor("EP(a) | EP(b)")
+        assert len(monitor.disjuncts) == 2
+
+        monitor.process_event(create_event("e1", {"P"}, {"P": 1}, {"a"}))
+        assert monitor.global_verdict == Verdict.TRUE
+
+        # Satisfies the second disjunct; the global verdict stays TRUE
+        monitor.process_event(create_event("e2", {"P"}, {"P": 2}, {"b"}))
+        assert monitor.global_verdict == Verdict.TRUE
+        assert monitor.seen_events["P"] == 2
+        assert monitor.finalize() == Verdict.TRUE
+        assert [d.verdict for d in monitor.disjuncts] == [Verdict.TRUE, Verdict.TRUE]
+
+    def test_every_disjunct_evaluated_after_one_holds(self):
+        """Test that disjuncts after a TRUE one still get their own verdicts."""
+        monitor = PBTLMonitor("EP(a) | EP(b) | EP(c)")
 
-        monitor.process_event(second_event)  # Should be buffered
+        monitor.process_event(create_event("e1", {"P"}, {"P": 1}, {"a", "b"}))
+
+        assert monitor.global_verdict == Verdict.TRUE
+        assert monitor.finalize() == Verdict.TRUE
+        assert [d.verdict for d in monitor.disjuncts] == [
+            Verdict.TRUE,
+            Verdict.TRUE,
+            Verdict.FALSE,
+        ]
+
+    @pytest.mark.parametrize("stop_on_verdict", [False, True])
+    def test_events_after_final_verdict_dropped_only_when_requested(
+        self, stop_on_verdict
+    ):
+        """Test that stop_on_verdict, not logging, decides whether events are kept."""
+        monitor = PBTLMonitor("EP(a) | EP(b)", stop_on_verdict=stop_on_verdict)
+        monitor.process_event(create_event("e1", {"P"}, {"P": 1}, {"a"}))
+        assert monitor.global_verdict == Verdict.TRUE
+
+        monitor.process_event(create_event("e2", {"P"}, {"P": 2}, {"b"}))
+        # Out of order, so it would otherwise wait in the causal buffer
+        e4 = create_event("e4", {"P"}, {"P": 4}, set())
+        monitor.process_event(e4)
+
+        assert monitor.global_verdict == Verdict.TRUE
+        if stop_on_verdict:
+            assert monitor.event_buffer == []
+            assert monitor.seen_events["P"] == 1
+        else:
+            assert monitor.event_buffer == [e4]
+            assert monitor.seen_events["P"] == 2
+
+    def test_process_events_mixes_direct_and_buffered_delivery(self):
+        """Test batch processing of a trace with a late-arriving event."""
+        monitor = PBTLMonitor("EP(EP(first) & EP(second) & EP(third))")
+        monitor.initialize_from_trace_processes(["P"])
+
+        events = [
+            create_event("first_ev", {"P"}, {"P": 1}, {"first"}),
+            create_event("third_ev", {"P"}, {"P": 3}, {"third"}),
+            SECOND_P2,
+        ]
+
+        assert monitor.process_events(events) == Verdict.TRUE
+        assert monitor.event_buffer == []
+        assert monitor.seen_events["P"] == 3
+
+    @pytest.mark.parametrize(
+        "stop_on_verdict, consumed", [(False, ["e1", "e2"]), (True, ["e1"])]
+    )
+    def test_process_events_stops_at_verdict_only_when_requested(
+        self, stop_on_verdict, consumed
+    ):
+        """Test that remaining events are consumed unless stop_on_verdict is set."""
+        monitor = PBTLMonitor("EP(a) | EP(b)", stop_on_verdict=stop_on_verdict)
+        taken = []
+
+        def trace():
+            for eid, props in [("e1", {"a"}), ("e2", {"b"})]:
+                taken.append(eid)
+                yield create_event(eid, {"P"}, {"P": len(taken)}, props)
+
+        assert monitor.process_events(trace()) == Verdict.TRUE
+        assert taken == consumed
+
+    def test_causal_order_delivers_reversed_events_without_buffering(
+        self, monitor_factory
+    ):
+        """Test that a batch is put in causal order before delivery."""
+        monitor = monitor_factory("EP(EP(first) & EP(second) & done)", ["P", "Q"])
+        events = [
+            create_event("first_ev", {"P"}, {"P": 1, "Q": 0}, {"first"}),
+            create_event("second_ev", {"Q"}, {"P": 1, "Q": 1}, {"second"}),
+            create_event("done_ev", {"P"}, {"P": 2, "Q": 1}, {"done"}),
+        ]
+
+        assert monitor.process_in_causal_order(reversed(events)) == Verdict.TRUE
+        assert monitor.event_buffer == []
+
+    def test_causal_order_differs_from_buffer_release_order(self):
+        """Test the one way reordering a batch can change the verdict.
+
+        e2 needs e1, which needs e0; e3 follows e1 on Q. Arriving as e2, e1,
+        e3, e0, the buffer releases e1 and e3 in the pass that follows e0,
+        and e2 only in the next pass, after the Q frontier has moved past q.
+        Reordered causally, e2 is placed as soon as e1 is, before e3.
+        """
+        batch = [
+            create_event("e2", {"P"}, {"P": 1, "Q": 2}, {"p"}),
+            create_event("e1", {"Q"}, {"P": 0, "Q": 2}, {"q"}),
+            create_event("e3", {"Q"}, {"P": 0, "Q": 3}, set()),
+            create_event("e0", {"Q"}, {"P": 0, "Q": 1}, set()),
+        ]
+        arrival = PBTLMonitor("EP(p & q)")
+        arrival.initialize_from_trace_processes(["P", "Q"])
+        reordered = PBTLMonitor("EP(p & q)")
+        reordered.initialize_from_trace_processes(["P", "Q"])
+
+        assert arrival.process_events(batch) == Verdict.UNKNOWN
+        assert arrival.finalize() == Verdict.FALSE
+        assert reordered.process_in_causal_order(batch) == Verdict.TRUE
+
+        # Given in causal order, both deliver the batch as it is
+        causal = [batch[3], batch[1], batch[0], batch[2]]
+        arrival.reset()
+        arrival.initialize_from_trace_processes(["P", "Q"])
+        assert arrival.process_events(causal) == Verdict.TRUE
+
+    def test_buffered_chain_flushed_when_first_event_arrives(self):
+        """Test that a late first event releases the whole waiting chain."""
+        monitor = PBTLMonitor("EP(EP(first) & EP(second) & third)")
+        monitor.initialize_from_trace_processes(["P"])
+
+        third = create_event("third_ev", {"P"}, {"P": 3}, {"third"})
+        monitor.process_event(third)
+        monitor.process_event(SECOND_P2)
+        assert monitor.event_buffer == [third, SECOND_P2]
         assert monitor.global_verdict == Verdict.UNKNOWN
 
-        monitor.process_event(first_event)  # Should flush both in order
+        monitor.process_event(create_event("first_ev", {"P"}, {"P": 1}, {"first"}))
+
         assert monitor.global_verdict == Verdict.TRUE
+        assert monitor.event_buffer == []
+
+    def test_buffered_concurrent_events_delivered_in_arrival_order(self):
+        """Test that flushing the buffer keeps concurrent events in arrival order.
+
+        The monitor follows a single frontier, so delivering the buffered
+        events by clock sum instead (e3 before e4) would satisfy both P-blocks
+        before the r on P0 and report TRUE.
+        """
+        monitor = PBTLMonitor("EP(EP(p) & EP(q) & !EP(r))")
+        monitor.initialize_from_trace_processes(["P0", "P1"])
+        trace = [
+            ("e2", {"P0"}, {"P0": 2, "P1": 1}, {"q", "r"}),
+            ("e3", {"P1"}, {"P0": 0, "P1": 2}, {"q"}),
+            ("e0", {"P0"}, {"P0": 1, "P1": 0}, {"p"}),
+            ("e4", {"P0"}, {"P0": 3, "P1": 1}, set()),
+            ("e1", {"P1"}, {"P0": 0, "P1": 1}, set()),
+        ]
+        for eid, procs, clock, props in trace:
+            monitor.process_event(create_event(eid, procs, clock, props))
+
+        assert monitor.event_buffer == []
+        assert monitor.finalize() == Verdict.FALSE
+
+    @pytest.mark.parametrize(
+        "clock, deliverable",
+        [
+            ({"P": 2, "Q": 1}, True),
+            ({"P": 2}, True),
+            ({"P": 3, "Q": 1}, False),
+            ({"P": 1, "Q": 1}, False),
+            ({"P": 2, "Q": 2}, False),
+        ],
+        ids=["next", "next_sparse", "gap", "stale", "ahead_of_other"],
+    )
+    def test_single_process_deliverability(self, clock, deliverable):
+        """Test causal delivery checks for events of a single process."""
+        monitor = PBTLMonitor("EP(p)")
+        monitor.initialize_from_trace_processes(["P", "Q"])
+        monitor.seen_events.update({"P": 1, "Q": 1})
+
+        event = create_event("ev", {"P"}, clock, set())
+        monitor.process_event(event)
+
+        assert (event not in monitor.event_buffer) == deliverable
+        assert monitor.seen_events["P"] == (2 if deliverable else 1)
+
+    def test_assume_ordered_bypasses_causal_buffer(self):
+        """Test that monitors told the order is causal deliver immediately."""
+        ordered = PBTLMonitor("EP(EP(first) & second)", assume_ordered=True)
+        ordered.initialize_from_trace_processes(["P"])
+        buffered = ordered.clone()
+        buffered.assume_ordered = False
+
+        # A gap in the trace holds the event back only when checking order
+        ordered.process_event(SECOND_P2)
+        buffered.process_event(SECOND_P2)
+
+        assert ordered.event_buffer == [] and ordered.seen_events["P"] == 2
+        assert buffered.event_buffer == [SECOND_P2]
 
     def test_multi_process_causal_consistency(self):
         """Test causal consistency across multiple processes."""
@@ -283,10 +780,8 @@ class TestMonitorJointEvents:
         monitor = PBTLMonitor("EP(sync_done)")
 
         # Prerequisites for joint event
-        p_tick = create_event("p_tick", {"P"}, {"P": 1}, set())
-        q_tick = create_event("q_tick", {"Q"}, {"Q": 1}, set())
-        monitor.process_event(p_tick)
-        monitor.process_event(q_tick)
+        monitor.process_event(TICK_P1)
+        monitor.process_event(TICK_Q1)
 
         # Joint event providing the required property
         joint_event = create_event("sync", {"P", "Q"}, {"P": 2, "Q": 2}, {"sync_done"})
@@ -299,10 +794,8 @@ class TestMonitorJointEvents:
         monitor = PBTLMonitor("EP(EP(handshake) & confirmed)")
 
         # Prerequisites
-        p_tick = create_event("p_tick", {"P"}, {"P": 1}, set())
-        q_tick = create_event("q_tick", {"Q"}, {"Q": 1}, set())
-        monitor.process_event(p_tick)
-        monitor.process_event(q_tick)
+        monitor.process_event(TICK_P1)
+        monitor.process_event(TICK_Q1)
 
         # Joint event satisfies P-block
         handshake_event = create_event(
@@ -324,42 +817,39 @@ class TestMonitorJointEvents:
         joint_event = create_event(
             "joint", {"P", "Q"}, {"P": 2, "Q": 2}, {"joint_prop"}
         )
-        monitor.process_event(joint_event)  # Should be buffered
 
-        assert monitor.global_verdict == Verdict.UNKNOWN
-
-        # Prerequisites arrive, allowing joint event delivery
-        p_tick = create_event("p_tick", {"P"}, {"P": 1}, set())
-        q_tick = create_event("q_tick", {"Q"}, {"Q": 1}, set())
-        monitor.process_event(p_tick)
-        monitor.process_event(q_tick)  # Should flush joint event
-
-        assert monitor.global_verdict == Verdict.TRUE
+        # Buffered until both prerequisites arrive, then delivered
+        run_trace(
+            monitor,
+            [
+                (joint_event, Verdict.UNKNOWN),
+                (TICK_P1, Verdict.UNKNOWN),
+                (TICK_Q1, Verdict.TRUE),
+            ],
+        )
 
 
 class TestMonitorComplexFormulas:
     """Test complex PBTL formula structures."""
 
-    def test_disjunction_one_branch_true(self):
-        """Test disjunctive formula where one branch succeeds."""
-        monitor = PBTLMonitor("EP(EP(option_a) | EP(option_b))")
-
-        # Only option_a occurs
-        option_a_event = create_event("a_ev", {"P"}, {"P": 1}, {"option_a"})
-        monitor.process_event(option_a_event)
-
-        assert monitor.global_verdict == Verdict.TRUE
-
-    def test_disjunction_both_branches_false(self):
-        """Test disjunctive formula where both branches fail."""
-        monitor = PBTLMonitor("EP(EP(option_a) | EP(option_b))")
-
-        # Neither option occurs
-        other_event = create_event("other_ev", {"P"}, {"P": 1}, {"other"})
-        monitor.process_event(other_event)
-
-        final_verdict = monitor.finalize()
-        assert final_verdict == Verdict.FALSE
+    @pytest.mark.parametrize(
+        "props, running_verdict, final_verdict",
+        [
+            ({"option_a"}, Verdict.TRUE, Verdict.TRUE),
+            ({"option_b"}, Verdict.TRUE, Verdict.TRUE),
+            ({"other"}, Verdict.UNKNOWN, Verdict.FALSE),
+        ],
+        ids=["first_branch", "second_branch", "neither_branch"],
+    )
+    def test_disjunction_branches(
+        self, monitor_factory, props, running_verdict, final_verdict
+    ):
+        """Test disjunctive formula where one or neither branch succeeds."""
+        monitor = monitor_factory("EP(EP(option_a) | EP(option_b))")
+        monitor.process_event(create_event("ev", {"P"}, {"P": 1}, props))
+
+        assert monitor.global_verdict == running_verdict
+        assert monitor.finalize() == final_verdict
 
     def test_nested_ep_formula(self):
         """Test nested EP formula evaluation."""
@@ -409,6 +899,23 @@ class TestMonitorEdgeCases:
         final_verdict = monitor.finalize()
         assert final_verdict == Verdict.FALSE
 
+    def test_event_results_only_formatted_when_logged(self, monkeypatch, log_level):
+        """Test that per-event result lines are skipped below INFO level."""
+        logger = get_logger()
+        reported = []
+        monkeypatch.setattr(
+            logger, "event_processed", lambda *args: reported.append(args)
+        )
+        monitor = PBTLMonitor("EP(target)")
+
+        log_level(LogLevel.WARNING)
+        monitor.process_event(TICK_P1)
+        assert reported == []
+
+        log_level(LogLevel.INFO)
+        monitor.process_event(create_event("e2", {"P"}, {"P": 2}, set()))
+        assert len(reported) == 1
+
     def test_iota_proposition_handling(self):
         """Test handling of special 'iota' proposition in initial states."""
         monitor = PBTLMonitor("EP(iota)")
@@ -453,6 +960,8 @@ class TestMonitorEdgeCases:
         monitor.process_event(event)
 
         first_verdict = monitor.finalize()
+        assert monitor.finalized
+
         second_verdict = monitor.finalize()
 
         assert first_verdict == second_verdict
@@ -503,137 +1012,122 @@ class TestMonitorEdgeCases:
             assert proc in initial_events
             assert initial_events[proc].has_prop("iota")
 
-    def test_simple_request_response_example(self):
-        """Test Example 1 (From README.md): Simple Request-Response scenario.
-
-        Property: EP(EP(request) & EP(response))
-        Expected Result: TRUE
-        """
-        monitor = PBTLMonitor("EP(EP(request) & EP(response))")
-        monitor.initialize_from_trace_processes(["Client", "Server"])
-
-        # Event 1: request
-        req_event = create_event(
-            "req", {"Client", "Server"}, {"Client": 1, "Server": 1}, {"request"}
-        )
-        monitor.process_event(req_event)
-
-        # Event 2: response
-        resp_event = create_event(
-            "resp", {"Server", "Client"}, {"Client": 2, "Server": 2}, {"response"}
-        )
-        monitor.process_event(resp_event)
-
-        # Finalize and check verdict
-        final_verdict = monitor.finalize()
-        assert final_verdict == Verdict.TRUE
-        assert monitor.global_verdict == Verdict.TRUE
-
-    def test_error_detection_example(self):
-        """Test Example 2 (From README.md): Error Detection scenario.
-
-        Property: EP(EP(process_started) & !EP(fatal_error))
-        Expected Result: FALSE (fatal_error violates the constraint)
-        """
-        monitor = PBTLMonitor("EP(EP(process_started) & !EP(fatal_error))")
-        monitor.initialize_from_trace_processes(["Worker"])
-
-        # Event 1: process started
-        start_event = create_event(
-            "start", {"Worker"}, {"Worker": 2}, {"process_started"}
-        )
-        monitor.process_event(start_event)
-
-        # Event 2: fatal error occurs
-        error_event = create_event("error", {"Worker"}, {"Worker": 1}, {"fatal_error"})
-        monitor.process_event(error_event)
-
-        # Finalize and check verdict
-        final_verdict = monitor.finalize()
-        assert final_verdict == Verdict.FALSE
-        assert monitor.global_verdict == Verdict.FALSE
-
-    def test_distributed_consensus_example(self):
-        """Test Example 3 (From README.md): Distributed Consensus scenario.
-
-        Property: EP(EP(prepare) & EP(commit) & !EP(abort))
-        Expected Result: TRUE
-        """
-        monitor = PBTLMonitor("EP(EP(prepare) & EP(commit) & !EP(abort))")
-        monitor.initialize_from_trace_processes(["Node1", "Node2", "Node3"])
-
-        # Event 1: Node1 prepares
-        prep1_event = create_event(
-            "prep1", {"Node1"}, {"Node1": 1, "Node2": 0, "Node3": 0}, {"prepare"}
-        )
-        monitor.process_event(prep1_event)
-
-        # Event 2: Node2 prepares
-        prep2_event = create_event(
-            "prep2", {"Node2"}, {"Node1": 0, "Node2": 1, "Node3": 0}, {"prepare"}
-        )
-        monitor.process_event(prep2_event)
-
-        # Event 3: Node3 prepares
-        prep3_event = create_event(
-            "prep3", {"Node3"}, {"Node1": 0, "Node2": 0, "Node3": 1}, {"prepare"}
-        )
-        monitor.process_event(prep3_event)
-
-        # Event 4: All nodes commit together
-        commit_event = create_event(
-            "commit",
-            {"Node1", "Node2", "Node3"},
-            {"Node1": 2, "Node2": 2, "Node3": 2},
-            {"commit"},
-        )
-        monitor.process_event(commit_event)
-
-        # Finalize and check verdict
-        final_verdict = monitor.finalize()
-        assert final_verdict == Verdict.TRUE
-        assert monitor.global_verdict == Verdict.TRUE
-
-    def test_distributed_consensus_with_abort_example(self):
-        """Test Example 3 variant (From README.md): Distributed Consensus with abort.
-
-        Property: EP(EP(prepare) & EP(commit) & !EP(abort))
-        Expected Result: FALSE (abort violates the constraint)
+    @pytest.mark.parametrize(
+        "formula, processes, events, expected",
+        [
+            pytest.param(
+                "EP(EP(request) & EP(response))",
+                ["Client", "Server"],
+                [
+                    (
+                        "req",
+                        {"Client", "Server"},
+                        {"Client": 1, "Server": 1},
+                        {"request"},
+                    ),
+                    (
+                        "resp",
+                        {"Server", "Client"},
+                        {"Client": 2, "Server": 2},
+                        {"response"},
+                    ),
+                ],
+                Verdict.TRUE,
+                id="request_response",
+            ),
+            pytest.param(
+                "EP(EP(process_started) & !EP(fatal_error))",
+                ["Worker"],
+                [
+                    ("start", {"Worker"}, {"Worker": 2}, {"process_started"}),
+                    ("error", {"Worker"}, {"Worker": 1}, {"fatal_error"}),
+                ],
+                Verdict.FALSE,
+                id="error_detection",
+            ),
+            pytest.param(
+                "EP(EP(prepare) & EP(commit) & !EP(abort))",
+                ["Node1", "Node2", "Node3"],
+                [
+                    (
+                        "prep1",
+                        {"Node1"},
+                        {"Node1": 1, "Node2": 0, "Node3": 0},
+                        {"prepare"},
+                    ),
+                    (
+                        "prep2",
+                        {"Node2"},
+                        {"Node1": 0, "Node2": 1, "Node3": 0},
+                        {"prepare"},
+                    ),
+                    (
+                        "prep3",
+                        {"Node3"},
+                        {"Node1": 0, "Node2": 0, "Node3": 1},
+                        {"prepare"},
+                    ),
+                    (
+                        "commit",
+                        {"Node1", "Node2", "Node3"},
+                        {"Node1": 2, "Node2": 2, "Node3": 2},
+                        {"commit"},
+                    ),
+                ],
+                Verdict.TRUE,
+                id="distributed_consensus",
+            ),
+            pytest.param(
+                "EP(EP(prepare) & EP(commit) & !EP(abort))",
+                ["Node1", "Node2", "Node3"],
+                [
+                    (
+                        "prep1",
+                        {"Node1"},
+                        {"Node1": 1, "Node2": 0, "Node3": 0},
+                        {"prepare"},
+                    ),
+                    (
+                        "prep2",
+                        {"Node2"},
+                        {"Node1": 0, "Node2": 1, "Node3": 0},
+                        {"prepare"},
+                    ),
+                    # Abort occurs instead of continuing, then a later commit
+                    (
+                        "abort",
+                        {"Node1", "Node2", "Node3"},
+                        {"Node1": 2, "Node2": 2, "Node3": 1},
+                        {"abort"},
+                    ),
+                    (
+                        "commit",
+                        {"Node1", "Node2", "Node3"},
+                        {"Node1": 3, "Node2": 3, "Node3": 2},
+                        {"commit"},
+                    ),
+                ],
+                Verdict.FALSE,
+                id="distributed_consensus_with_abort",
+            ),
+        ],
+    )
+    def test_readme_examples(
+        self, monitor_factory, formula, processes, events, expected
+    ):
+        """Test the README.md examples end to end.
+
+        Each case feeds its events in order, finalizes, and checks the verdict.
+
+        Args:
+            formula: PBTL property of the example
+            processes: System processes declared by the trace
+            events: (eid, processes, clock, props) tuples in trace order
+            expected: Final verdict given in the README
         """
-        monitor = PBTLMonitor("EP(EP(prepare) & EP(commit) & !EP(abort))")
-        monitor.initialize_from_trace_processes(["Node1", "Node2", "Node3"])
-
-        # Event 1: Node1 prepares
-        prep1_event = create_event(
-            "prep1", {"Node1"}, {"Node1": 1, "Node2": 0, "Node3": 0}, {"prepare"}
-        )
-        monitor.process_event(prep1_event)
+        monitor = monitor_factory(formula, processes)
+        monitor.process_events(create_event(*event) for event in events)
 
-        # Event 2: Node2 prepares
-        prep2_event = create_event(
-            "prep2", {"Node2"}, {"Node1": 0, "Node2": 1, "Node3": 0}, {"prepare"}
-        )
-        monitor.process_event(prep2_event)
-
-        # Event 3: Abort occurs instead of continuing
-        abort_event = create_event(
-            "abort",
-            {"Node1", "Node2", "Node3"},
-            {"Node1": 2, "Node2": 2, "Node3": 1},
-            {"abort"},
-        )
-        monitor.process_event(abort_event)
-
-        # Event 4: Later commit (but abort already happened)
-        commit_event = create_event(
-            "commit",
-            {"Node1", "Node2", "Node3"},
-            {"Node1": 3, "Node2": 3, "Node3": 2},
-            {"commit"},
-        )
-        monitor.process_event(commit_event)
-
-        # Finalize and check verdict
         final_verdict = monitor.finalize()
-        assert final_verdict == Verdict.FALSE
-        assert monitor.global_verdict == Verdict.FALSE
+        assert final_verdict == expected
+        assert monitor.global_verdict == expected
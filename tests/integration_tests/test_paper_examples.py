@@ -23,23 +23,40 @@ import pytest
 from core.monitor import PBTLMonitor
 from core.event import Event, VectorClock
 from core.verdict import Verdict
+from tests.helpers import shared_set
 
 
 def create_event(
-    eid: str, procs: set[str], clock: dict[str, int], props: set[str]
+    eid: str,
+    procs: set[str],
+    clock: dict[str, int] | list[int] | VectorClock,
+    props: set[str],
+    order: list[str] | None = None,
 ) -> Event:
     """Factory function for creating Event objects in tests.
 
+    Events that share processes, propositions or a mapping clock share those
+    objects, so equal components compare by identity first.
+
     Args:
         eid: Event identifier
         procs: Set of participating process names
-        clock: Vector clock mapping process names to timestamps
+        clock: Vector clock, mapping of process names to timestamps, or
+            timestamps listed positionally in ``order``
         props: Set of propositions that hold after event execution
+        order: Process names giving the meaning of each position of a
+            positional ``clock``
 
     Returns:
         Event: Configured event instance for testing
     """
-    return Event(eid, frozenset(procs), VectorClock(clock), frozenset(props))
+    if isinstance(clock, VectorClock):
+        vc = clock
+    elif order is not None:
+        vc = VectorClock.from_row(clock, order)
+    else:
+        vc = VectorClock.intern(clock)
+    return Event(eid, shared_set(procs), vc, shared_set(props))
 
 
 class TestPaperExampleScenarios:
@@ -55,221 +72,115 @@ class TestPaperExampleScenarios:
         Complete trace with 8 events across 3 processes (PA, PB, PC).
         Expected: TRUE because N ≰ P (frontiers are concurrent).
         """
+        processes = ["PA", "PB", "PC"]
         monitor = PBTLMonitor("EP(EP(p) & EP(q) & !EP(r))")
-        monitor.initialize_from_trace_processes(["PA", "PB", "PC"])
+        monitor.initialize_from_trace_processes(processes)
 
         # Complete event sequence from research example
         events = [
-            create_event("ev1", {"PB"}, {"PA": 0, "PB": 1, "PC": 0}, {"q"}),
-            create_event("ev2", {"PA"}, {"PA": 1, "PB": 0, "PC": 0}, {"pa_setup"}),
-            create_event("ev3", {"PC"}, {"PA": 0, "PB": 0, "PC": 1}, {"pc_setup"}),
-            create_event("ev4", {"PC"}, {"PA": 0, "PB": 0, "PC": 2}, {"r"}),
-            create_event("ev5", {"PA"}, {"PA": 2, "PB": 0, "PC": 0}, {"p"}),
+            create_event("ev1", {"PB"}, [0, 1, 0], {"q"}, processes),
+            create_event("ev2", {"PA"}, [1, 0, 0], {"pa_setup"}, processes),
+            create_event("ev3", {"PC"}, [0, 0, 1], {"pc_setup"}, processes),
+            create_event("ev4", {"PC"}, [0, 0, 2], {"r"}, processes),
+            create_event("ev5", {"PA"}, [2, 0, 0], {"p"}, processes),
             create_event(
-                "ev6", {"PA", "PC"}, {"PA": 3, "PB": 0, "PC": 3}, {"sync_ac_after_pr"}
+                "ev6", {"PA", "PC"}, [3, 0, 3], {"sync_ac_after_pr"}, processes
             ),
             create_event(
-                "ev7", {"PB", "PC"}, {"PA": 3, "PB": 2, "PC": 4}, {"sync_bc_after_qr"}
+                "ev7", {"PB", "PC"}, [3, 2, 4], {"sync_bc_after_qr"}, processes
             ),
             create_event(
                 "ev8",
                 {"PA", "PB", "PC"},
-                {"PA": 4, "PB": 3, "PC": 5},
+                [4, 3, 5],
                 {"sync_all_final"},
+                processes,
             ),
         ]
 
+        reached = None
         for event in events:
             monitor.process_event(event)
             # Verify r occurrence doesn't cause premature failure
             if event.eid == "ev4":
                 assert monitor.global_verdict == Verdict.UNKNOWN
+            # A conclusive verdict survives the rest of the trace
+            if reached is not None:
+                assert monitor.global_verdict == reached
+            elif monitor.is_conclusive():
+                reached = monitor.global_verdict
 
         # Final verdict should be TRUE due to concurrent N-constraint
         assert monitor.global_verdict == Verdict.TRUE
 
-    def test_example_2_complex_disjunction_failure(self):
+    def test_example_2_complex_disjunction_failure(self, example2_trace):
         """Test Example 2: EP((EP(s1) & !EP(j1)) | (EP(j2) & ms & !EP(s2))) - FALSE case.
 
         This example tests a complex disjunctive formula where both disjuncts fail:
         - First disjunct fails because j1 occurs before s1
         - Second disjunct fails because s2 occurs, violating !EP(s2)
 
-        Uses a comprehensive 85-event trace from distributed system execution.
+        Uses a comprehensive 85-event trace from distributed system execution,
+        stored in tests/fixtures/example2.csv.
         Expected: FALSE (both disjuncts fail).
         """
+        processes, events = example2_trace
         monitor = PBTLMonitor("EP((EP(s1) & !EP(j1)) | (EP(j2) & ms & !EP(s2)))")
-        monitor.initialize_from_trace_processes(["S1", "J1", "J2", "MS", "S2", "PO"])
-
-        # Comprehensive 85-event trace from research example
-        events = [
-            create_event(
-                "s1_int1",
-                {"S1"},
-                {"S1": 1, "J1": 0, "J2": 0, "MS": 0, "S2": 0, "PO": 0},
-                {"dS1"},
-            ),
-            create_event(
-                "j1_int2",
-                {"J1"},
-                {"S1": 0, "J1": 1, "J2": 0, "MS": 0, "S2": 0, "PO": 0},
-                {"dJ1"},
-            ),
-            create_event(
-                "j2_int3",
-                {"J2"},
-                {"S1": 0, "J1": 0, "J2": 1, "MS": 0, "S2": 0, "PO": 0},
-                {"dJ2"},
-            ),
-            create_event(
-                "ms_int4",
-                {"MS"},
-                {"S1": 0, "J1": 0, "J2": 0, "MS": 1, "S2": 0, "PO": 0},
-                {"dMS"},
-            ),
-            create_event(
-                "s2_int5",
-                {"S2"},
-                {"S1": 0, "J1": 0, "J2": 0, "MS": 0, "S2": 1, "PO": 0},
-                {"dS2"},
-            ),
-            create_event(
-                "po_eval6",
-                {"PO"},
-                {"S1": 0, "J1": 0, "J2": 0, "MS": 0, "S2": 0, "PO": 1},
-                {"poe"},
-            ),
-            create_event(
-                "s1_int7",
-                {"S1"},
-                {"S1": 2, "J1": 0, "J2": 0, "MS": 0, "S2": 0, "PO": 0},
-                {"dS1"},
-            ),
-            create_event(
-                "j1_int8",
-                {"J1"},
-                {"S1": 0, "J1": 2, "J2": 0, "MS": 0, "S2": 0, "PO": 0},
-                {"dJ1"},
-            ),
-            create_event(
-                "j2_int9",
-                {"J2"},
-                {"S1": 0, "J1": 0, "J2": 2, "MS": 0, "S2": 0, "PO": 0},
-                {"dJ2"},
-            ),
-            create_event(
-                "ms_int10",
-                {"MS"},
-                {"S1": 0, "J1": 0, "J2": 0, "MS": 2, "S2": 0, "PO": 0},
-                {"dMS"},
-            ),
-            create_event(
-                "s2_int11",
-                {"S2"},
-                {"S1": 0, "J1": 0, "J2": 0, "MS": 0, "S2": 2, "PO": 0},
-                {"dS2"},
-            ),
-            create_event(
-                "s2_po_comm12",
-                {"S2", "PO"},
-                {"J1": 0, "S2": 3, "J2": 0, "MS": 0, "PO": 2, "S1": 0},
-                {"cS2PO"},
-            ),
-            create_event(
-                "po_eval13",
-                {"PO"},
-                {"J1": 0, "S2": 3, "J2": 0, "MS": 0, "PO": 3, "S1": 0},
-                {"k_not_j1", "k_not_s2", "poe"},
-            ),
-            create_event(
-                "s1_int14",
-                {"S1"},
-                {"S1": 3, "J1": 0, "J2": 0, "MS": 0, "S2": 0, "PO": 0},
-                set(),
-            ),
-            create_event(
-                "j1_int15",
-                {"J1"},
-                {"S1": 0, "J1": 3, "J2": 0, "MS": 0, "S2": 0, "PO": 0},
-                {"j1"},
-            ),
-            create_event(
-                "j2_int16",
-                {"J2"},
-                {"S1": 0, "J1": 0, "J2": 3, "MS": 0, "S2": 0, "PO": 0},
-                {"j2"},
-            ),
-            create_event(
-                "ms_int17",
-                {"MS"},
-                {"S1": 0, "J1": 0, "J2": 0, "MS": 3, "S2": 0, "PO": 0},
-                set(),
-            ),
-            create_event(
-                "s2_int18",
-                {"S2"},
-                {"J1": 0, "S2": 4, "J2": 0, "MS": 0, "PO": 2, "S1": 0},
-                set(),
-            ),
-            create_event(
-                "s1_po_comm19",
-                {"S1", "PO"},
-                {"J1": 0, "S2": 3, "J2": 0, "MS": 0, "PO": 4, "S1": 4},
-                {"cS1PO"},
-            ),
-            create_event(
-                "j1_po_comm20",
-                {"J1", "PO"},
-                {"J1": 4, "S2": 3, "J2": 0, "MS": 0, "PO": 5, "S1": 4},
-                {"cJ1PO"},
-            ),
-            # Continue with remaining events...
-            create_event(
-                "j2_po_comm21",
-                {"J2", "PO"},
-                {"J1": 4, "S2": 3, "J2": 4, "MS": 0, "PO": 6, "S1": 4},
-                {"cJ2PO"},
-            ),
-            create_event(
-                "ms_po_comm22",
-                {"MS", "PO"},
-                {"J1": 4, "S2": 3, "J2": 4, "MS": 4, "PO": 7, "S1": 4},
-                {"cMSPO"},
-            ),
-            create_event(
-                "s2_po_comm23",
-                {"S2", "PO"},
-                {"J1": 4, "S2": 5, "J2": 4, "MS": 4, "PO": 8, "S1": 4},
-                {"cS2PO"},
-            ),
-            create_event(
-                "po_eval24",
-                {"PO"},
-                {"J1": 4, "S2": 5, "J2": 4, "MS": 4, "PO": 9, "S1": 4},
-                {"kJ1", "kJ2", "k_not_s2", "poe"},
-            ),
-            # Key events that determine failure
-            create_event(
-                "s2_int38",
-                {"S2"},
-                {"J1": 4, "S2": 7, "J2": 4, "MS": 4, "PO": 8, "S1": 4},
-                {"s2"},
-            ),
-            create_event(
-                "s1_int60",
-                {"S1"},
-                {"J1": 6, "S2": 10, "J2": 6, "MS": 9, "PO": 22, "S1": 13},
-                {"s1"},
-            ),
-        ]
+        monitor.initialize_from_trace_processes(processes)
 
-        for event in events:
-            monitor.process_event(event)
+        monitor.process_events(events)
 
         # Final verdict should be FALSE (both disjuncts fail)
         final_verdict = monitor.finalize()
         assert final_verdict == Verdict.FALSE
 
+    @pytest.mark.parametrize(
+        "formula",
+        [
+            "EP((EP(s1) & !EP(j1)) | (EP(j2) & ms & !EP(s2)))",
+            "EP(EP(dS1) & EP(dJ1) & poe)",
+            "EP(dS1 & dJ2 & dMS)",
+        ],
+    )
+    def test_example_2_causal_order_matches_arrival_order_when_ordered(
+        self, monitor_factory, example2_trace, formula
+    ):
+        """Test that a trace already in causal order is delivered as given."""
+        processes, events = example2_trace
+        in_order = monitor_factory(formula, processes)
+        in_order.process_events(events)
+
+        batched = monitor_factory(formula, processes)
+        batched.process_in_causal_order(events)
+
+        assert batched.finalize() == in_order.finalize()
+
+    def test_example_2_reversed_trace_put_in_causal_order(
+        self, monitor_factory, example2_trace
+    ):
+        """Test that a reversed batch is reordered causally before delivery."""
+        processes, events = example2_trace
+        in_order = monitor_factory("EP(never)", processes)
+        in_order.process_events(events)
+
+        batched = monitor_factory("EP(never)", processes)
+        batched.process_in_causal_order(reversed(events))
+
+        # The same events are delivered; only the two with gaps in their
+        # history are left waiting, as in trace order
+        assert batched.seen_events == in_order.seen_events
+        assert set(batched.event_buffer) == set(in_order.event_buffer)
+        assert len(batched.event_buffer) == 2
+
+    def test_example_2_trace_shares_process_and_prop_sets(self, example2_trace):
+        """Test that events read from a trace share equal process and prop sets."""
+        _, events = example2_trace
+        s1_events = [e for e in events if e.processes == frozenset({"S1"})]
+
+        assert len(s1_events) > 1
+        assert all(e.processes is s1_events[0].processes for e in s1_events)
+        assert all(e.props is s1_events[0].props for e in s1_events[:2])
+
     def test_example_3_early_n_violation_correction(self):
         """Test Example 3: EP(EP(a) & EP(b) & EP(c) & !EP(d)) - TRUE case.
 
@@ -280,87 +191,71 @@ class TestPaperExampleScenarios:
         The property should succeed because all P-blocks are eventually satisfied
         and the N-constraint is properly evaluated at the right frontier.
         """
+        processes = ["PA", "PB", "PC", "PD", "PV"]
         monitor = PBTLMonitor("EP(EP(a) & EP(b) & EP(c) & !EP(d))")
-        monitor.initialize_from_trace_processes(["PA", "PB", "PC", "PD", "PV"])
+        monitor.initialize_from_trace_processes(processes)
 
         # Complete 18-event trace demonstrating correct behavior
         events = [
-            create_event(
-                "pa_int1", {"PA"}, {"PA": 1, "PB": 0, "PC": 0, "PD": 0, "PV": 0}, set()
-            ),
-            create_event(
-                "pb_int2", {"PB"}, {"PA": 0, "PB": 1, "PC": 0, "PD": 0, "PV": 0}, {"b"}
-            ),
-            create_event(
-                "pc_int3", {"PC"}, {"PA": 0, "PB": 0, "PC": 1, "PD": 0, "PV": 0}, {"c"}
-            ),
-            create_event(
-                "pd_int4", {"PD"}, {"PA": 0, "PB": 0, "PC": 0, "PD": 1, "PV": 0}, set()
-            ),
+            create_event("pa_int1", {"PA"}, [1, 0, 0, 0, 0], set(), processes),
+            create_event("pb_int2", {"PB"}, [0, 1, 0, 0, 0], {"b"}, processes),
+            create_event("pc_int3", {"PC"}, [0, 0, 1, 0, 0], {"c"}, processes),
+            create_event("pd_int4", {"PD"}, [0, 0, 0, 1, 0], set(), processes),
             create_event(
                 "pa_pv_comm5",
                 {"PA", "PV"},
-                {"PV": 1, "PB": 0, "PD": 0, "PA": 2, "PC": 0},
+                [2, 0, 0, 0, 1],
                 {"comm_pa_pv"},
+                processes,
             ),
             create_event(
                 "pd_pv_comm6",
                 {"PD", "PV"},
-                {"PV": 2, "PB": 0, "PD": 2, "PA": 2, "PC": 0},
+                [2, 0, 0, 2, 2],
                 {"comm_pd_pv"},
+                processes,
             ),
             create_event(
                 "pv_decide7",
                 {"PV"},
-                {"PV": 3, "PB": 0, "PD": 2, "PA": 2, "PC": 0},
+                [2, 0, 0, 2, 3],
                 {"pv_confirms_not_d", "pv_evaluates_cycle"},
+                processes,
             ),
-            create_event(
-                "pa_int8", {"PA"}, {"PV": 1, "PB": 0, "PD": 0, "PA": 3, "PC": 0}, set()
-            ),
-            create_event(
-                "pb_int9", {"PB"}, {"PA": 0, "PB": 2, "PC": 0, "PD": 0, "PV": 0}, {"b"}
-            ),
-            create_event(
-                "pc_int10", {"PC"}, {"PA": 0, "PB": 0, "PC": 2, "PD": 0, "PV": 0}, {"c"}
-            ),
+            create_event("pa_int8", {"PA"}, [3, 0, 0, 0, 1], set(), processes),
+            create_event("pb_int9", {"PB"}, [0, 2, 0, 0, 0], {"b"}, processes),
+            create_event("pc_int10", {"PC"}, [0, 0, 2, 0, 0], {"c"}, processes),
             # Critical: d occurs but should not cause early failure
-            create_event(
-                "pd_int11", {"PD"}, {"PV": 2, "PB": 0, "PD": 3, "PA": 2, "PC": 0}, {"d"}
-            ),
+            create_event("pd_int11", {"PD"}, [2, 0, 0, 3, 2], {"d"}, processes),
             create_event(
                 "pa_pv_comm12",
                 {"PA", "PV"},
-                {"PV": 4, "PB": 0, "PD": 2, "PA": 4, "PC": 0},
+                [4, 0, 0, 2, 4],
                 {"comm_pa_pv"},
+                processes,
             ),
             create_event(
                 "pc_pv_comm13",
                 {"PC", "PV"},
-                {"PV": 5, "PB": 0, "PD": 2, "PA": 4, "PC": 3},
+                [4, 0, 3, 2, 5],
                 {"comm_pc_pv"},
+                processes,
             ),
             create_event(
                 "pv_decide14",
                 {"PV"},
-                {"PV": 6, "PB": 0, "PD": 2, "PA": 4, "PC": 3},
+                [4, 0, 3, 2, 6],
                 {"pv_confirms_not_d", "pv_evaluates_cycle", "pv_knows_c"},
+                processes,
             ),
             # Critical: a occurs and should make property TRUE
-            create_event(
-                "pa_int15", {"PA"}, {"PV": 4, "PB": 0, "PD": 2, "PA": 5, "PC": 0}, {"a"}
-            ),
-            create_event(
-                "pb_int16", {"PB"}, {"PA": 0, "PB": 3, "PC": 0, "PD": 0, "PV": 0}, {"b"}
-            ),
-            create_event(
-                "pc_int17", {"PC"}, {"PV": 5, "PB": 0, "PD": 2, "PA": 4, "PC": 4}, set()
-            ),
-            create_event(
-                "pd_int18", {"PD"}, {"PV": 2, "PB": 0, "PD": 4, "PA": 2, "PC": 0}, set()
-            ),
+            create_event("pa_int15", {"PA"}, [5, 0, 0, 2, 4], {"a"}, processes),
+            create_event("pb_int16", {"PB"}, [0, 3, 0, 0, 0], {"b"}, processes),
+            create_event("pc_int17", {"PC"}, [4, 0, 4, 2, 5], set(), processes),
+            create_event("pd_int18", {"PD"}, [2, 0, 0, 4, 2], set(), processes),
         ]
 
+        reached = None
         for event in events:
             monitor.process_event(event)
 
@@ -376,6 +271,12 @@ class TestPaperExampleScenarios:
                     monitor.global_verdict == Verdict.TRUE
                 ), "Monitor should succeed when a occurs"
 
+            # The verdict is final, later events cannot change it
+            if reached is not None:
+                assert monitor.global_verdict == reached
+            elif monitor.is_conclusive():
+                reached = monitor.global_verdict
+
         # Final verification
         assert monitor.global_verdict == Verdict.TRUE
 
@@ -390,42 +291,54 @@ class TestAdvancedAlgorithmicScenarios:
         by checking P+N cases that require computing the conjunction of P-blocks
         with different satisfaction frontiers.
         """
+        processes = ["P1", "P2", "P3", "N"]
         monitor = PBTLMonitor("EP(EP(p1) & EP(p2) & EP(p3) & !EP(n1))")
-        monitor.initialize_from_trace_processes(["P1", "P2", "P3", "N"])
-
-        # Create events where P-blocks are satisfied at different times/processes
-        events = [
-            create_event(
-                "p1_step1", {"P1"}, {"P1": 1, "P2": 0, "P3": 0, "N": 0}, set()
-            ),
-            create_event(
-                "p1_event", {"P1"}, {"P1": 2, "P2": 0, "P3": 0, "N": 0}, {"p1"}
-            ),
-            create_event(
-                "p2_step1", {"P2"}, {"P1": 0, "P2": 1, "P3": 0, "N": 0}, set()
-            ),
-            create_event(
-                "p2_step2", {"P2"}, {"P1": 0, "P2": 2, "P3": 0, "N": 0}, set()
-            ),
-            create_event(
-                "p2_event", {"P2"}, {"P1": 0, "P2": 3, "P3": 0, "N": 0}, {"p2"}
-            ),
-            create_event(
-                "p3_event", {"P3"}, {"P1": 0, "P2": 0, "P3": 1, "N": 0}, {"p3"}
-            ),
-            create_event(
-                "n1_event", {"N"}, {"P1": 1, "P2": 1, "P3": 0, "N": 1}, {"n1"}
-            ),
+        monitor.initialize_from_trace_processes(processes)
+
+        # P-blocks are satisfied at different times/processes, one row per
+        # event: (eid, participating processes, clock in `processes` order, props)
+        rows = [
+            ("p1_step1", {"P1"}, (1, 0, 0, 0), set()),
+            ("p1_event", {"P1"}, (2, 0, 0, 0), {"p1"}),
+            ("p2_step1", {"P2"}, (0, 1, 0, 0), set()),
+            ("p2_step2", {"P2"}, (0, 2, 0, 0), set()),
+            ("p2_event", {"P2"}, (0, 3, 0, 0), {"p2"}),
+            ("p3_event", {"P3"}, (0, 0, 1, 0), {"p3"}),
+            ("n1_event", {"N"}, (1, 1, 0, 1), {"n1"}),
         ]
 
-        for event in events:
-            monitor.process_event(event)
+        monitor.process_rows(processes, rows)
 
         # LUB should be [P1:2, P2:3, P3:1, N:0]
         # N-event VC is [P1:1, P2:1, P3:0, N:1]
         # Since N ≰ LUB (P2 component: 1 < 3), constraint satisfied
         assert monitor.global_verdict == Verdict.TRUE
 
+    def test_lub_over_wide_system_detects_n_violation(self):
+        """Test P-conjunction LUB over eight processes catching a causal N-block."""
+        processes = [f"P{i}" for i in range(1, 9)]
+        formula = "EP(" + " & ".join(f"EP(p{i})" for i in range(1, 8)) + " & !EP(n))"
+        monitor = PBTLMonitor(formula)
+        monitor.initialize_from_trace_processes(processes)
+
+        # P8 raises n, which P1 learns of before raising p1; the rest are
+        # independent local events
+        events = [create_event("n_event", {"P8"}, [0] * 7 + [1], {"n"}, processes)]
+        events.append(
+            create_event("p1_event", {"P1"}, [1] + [0] * 6 + [1], {"p1"}, processes)
+        )
+        for i in range(2, 8):
+            clock = [0] * 8
+            clock[i - 1] = 1
+            events.append(
+                create_event(f"p{i}_event", {f"P{i}"}, clock, {f"p{i}"}, processes)
+            )
+
+        monitor.process_events(events)
+
+        # n ≤ LUB of the P-block frontiers through P1's knowledge of P8
+        assert monitor.global_verdict == Verdict.FALSE
+
     def test_concurrent_events_n_constraint_detailed(self):
         """Test detailed N-constraint checking with concurrent events.
 
@@ -445,13 +358,13 @@ class TestAdvancedAlgorithmicScenarios:
         monitor.process_event(q_event)
         assert monitor.global_verdict == Verdict.TRUE  # Should remain TRUE
 
-    def test_p_m_n_case_with_early_n_violation(self):
+    def test_p_m_n_case_with_early_n_violation(self, monitor_factory):
         """Test P+M+N case where N-block is violated early.
 
         Ensures that the early N-violation detection works correctly
         for P+M+N cases, not just P+N cases.
         """
-        monitor = PBTLMonitor("EP(EP(init) & ready & !EP(error))")
+        monitor = monitor_factory("EP(EP(init) & ready & !EP(error))")
         monitor.initialize_from_trace_processes(["P"])
 
         events = [
@@ -464,18 +377,24 @@ class TestAdvancedAlgorithmicScenarios:
             ),  # M-literal satisfied later
         ]
 
+        reached = None
         for event in events:
             monitor.process_event(event)
             if event.eid == "error_event":
                 # Should fail when error occurs
                 assert monitor.global_verdict == Verdict.FALSE
+            # A conclusive verdict survives the rest of the trace
+            if reached is not None:
+                assert monitor.global_verdict == reached
+            elif monitor.is_conclusive():
+                reached = monitor.global_verdict
 
         # Should remain FALSE due to N-constraint violation
         assert monitor.global_verdict == Verdict.FALSE
 
-    def test_p_m_n_case_with_concurrent_n_success(self):
+    def test_p_m_n_case_with_concurrent_n_success(self, monitor_factory):
         """Test P+M+N case where N-block is concurrent (not violated)."""
-        monitor = PBTLMonitor("EP(EP(init) & ready & !EP(error))")
+        monitor = monitor_factory("EP(EP(init) & ready & !EP(error))")
         monitor.initialize_from_trace_processes(["P", "Q"])
 
         events = [
@@ -495,9 +414,9 @@ class TestAdvancedAlgorithmicScenarios:
         # N ≰ M because Q component: 1 > 0
         assert monitor.global_verdict == Verdict.TRUE
 
-    def test_multi_process_concurrent_n_constraint(self):
+    def test_multi_process_concurrent_n_constraint(self, monitor_factory):
         """Test N-constraint with multi-process concurrent events."""
-        monitor = PBTLMonitor("EP(EP(init) & ready & !EP(error))")
+        monitor = monitor_factory("EP(EP(init) & ready & !EP(error))")
         monitor.initialize_from_trace_processes(["P", "Q", "R"])
 
         events = [
@@ -526,45 +445,43 @@ class TestPerformanceAndScalability:
         Simulates processing many events to ensure the monitor scales
         reasonably and maintains correctness with larger traces.
         """
-        monitor = PBTLMonitor("EP(EP(target) & !EP(blocker))")
+        monitor = PBTLMonitor(
+            "EP(EP(target) & !EP(blocker))", assume_ordered=True, stop_on_verdict=True
+        )
         monitor.initialize_from_trace_processes(["P", "Q"])
 
-        # Create 100 events with target appearing mid-sequence
+        # Create 100 events, generated in causal order with target appearing mid-sequence.
+        # Each clock on the P chain only advances P over its predecessor.
         events = []
+        clock = VectorClock({"P": 0, "Q": 0})
         for i in range(1, 101):
+            clock = VectorClock.from_delta(clock, {"P": i})
             if i == 50:
-                events.append(
-                    create_event(f"target_{i}", {"P"}, {"P": i, "Q": 0}, {"target"})
-                )
+                events.append(create_event(f"target_{i}", {"P"}, clock, {"target"}))
             else:
-                events.append(
-                    create_event(f"event_{i}", {"P"}, {"P": i, "Q": 0}, {"other"})
-                )
-
-        for event in events:
-            monitor.process_event(event)
+                events.append(create_event(f"event_{i}", {"P"}, clock, {"other"}))
 
+        assert monitor.process_events(events) == Verdict.TRUE
         assert monitor.global_verdict == Verdict.TRUE
 
+        # Events after the verdict became final are not consumed
+        assert monitor.seen_events["P"] == 50
+
     def test_complex_vector_clock_relationships(self):
         """Test complex vector clock relationships across multiple processes."""
+        processes = ["P1", "P2", "P3"]
         monitor = PBTLMonitor("EP(EP(final) & !EP(intermediate))")
-        monitor.initialize_from_trace_processes(["P1", "P2", "P3"])
-
-        # Create complex causal chain
-        events = [
-            create_event("p1_start", {"P1"}, {"P1": 1, "P2": 0, "P3": 0}, set()),
-            create_event("p2_response", {"P2"}, {"P1": 1, "P2": 1, "P3": 0}, set()),
-            create_event(
-                "p3_intermediate", {"P3"}, {"P1": 1, "P2": 1, "P3": 1}, {"intermediate"}
-            ),
-            create_event(
-                "p1_final", {"P1"}, {"P1": 2, "P2": 0, "P3": 0}, {"final"}
-            ),  # Concurrent with p3
+        monitor.initialize_from_trace_processes(processes)
+
+        # Complex causal chain; p1_final is concurrent with p3_intermediate
+        rows = [
+            ("p1_start", {"P1"}, (1, 0, 0), set()),
+            ("p2_response", {"P2"}, (1, 1, 0), set()),
+            ("p3_intermediate", {"P3"}, (1, 1, 1), {"intermediate"}),
+            ("p1_final", {"P1"}, (2, 0, 0), {"final"}),
         ]
 
-        for event in events:
-            monitor.process_event(event)
+        monitor.process_rows(processes, rows)
 
         # Should succeed because final is concurrent with intermediate
         assert monitor.global_verdict == Verdict.TRUE
@@ -573,9 +490,9 @@ class TestPerformanceAndScalability:
 class TestEdgeCasesAndCornerCases:
     """Test edge cases that might reveal algorithmic issues."""
 
-    def test_simultaneous_p_and_n_satisfaction(self):
+    def test_simultaneous_p_and_n_satisfaction(self, monitor_factory):
         """Test case where P and N blocks are satisfied by the same event."""
-        monitor = PBTLMonitor("EP(EP(both) & !EP(both))")
+        monitor = monitor_factory("EP(EP(both) & !EP(both))")
 
         # Single event satisfies both P and N - should fail
         event = create_event("both_event", {"P"}, {"P": 1}, {"both"})
@@ -583,30 +500,29 @@ class TestEdgeCasesAndCornerCases:
 
         assert monitor.global_verdict == Verdict.FALSE
 
-    def test_multiple_n_blocks_with_different_violations(self):
-        """Test multiple N-blocks where some violate and others don't."""
-        monitor = PBTLMonitor("EP(EP(target) & !EP(early) & !EP(late))")
-        monitor.initialize_from_trace_processes(["P"])
-
-        events = [
-            create_event(
-                "early_event", {"P"}, {"P": 1}, {"early"}
-            ),  # This N-block violated
-            create_event(
-                "target_event", {"P"}, {"P": 2}, {"target"}
-            ),  # P-block satisfied
-            # late never occurs, so that N-block not violated
-        ]
-
-        for event in events:
-            monitor.process_event(event)
-
-        # Should fail because early ≤ target
+    @pytest.mark.parametrize(
+        "formula, n_prop, p_prop",
+        [
+            # Only the first of two N-blocks occurs; late never does
+            ("EP(EP(target) & !EP(early) & !EP(late))", "early", "target"),
+            ("EP(EP(late_prop) & !EP(early_prop))", "early_prop", "late_prop"),
+        ],
+    )
+    def test_single_process_n_block_before_p_block_fails(
+        self, monitor_factory, formula, n_prop, p_prop
+    ):
+        """Test that an N-block event preceding the P-block event on one process fails."""
+        monitor = monitor_factory(formula, ["P"])
+
+        monitor.process_event(create_event("n_event", {"P"}, {"P": 1}, {n_prop}))
+        monitor.process_event(create_event("p_event", {"P"}, {"P": 2}, {p_prop}))
+
+        # Should fail because the N-block event ≤ the P-block event
         assert monitor.global_verdict == Verdict.FALSE
 
-    def test_empty_propositions_events(self):
+    def test_empty_propositions_events(self, monitor_factory):
         """Test events with no propositions."""
-        monitor = PBTLMonitor("EP(EP(target) & !EP(blocker))")
+        monitor = monitor_factory("EP(EP(target) & !EP(blocker))")
 
         events = [
             create_event("empty1", {"P"}, {"P": 1}, set()),
@@ -638,24 +554,6 @@ class TestEdgeCasesAndCornerCases:
         final_verdict = monitor.finalize()
         assert final_verdict == Verdict.FALSE
 
-    def test_single_process_early_n_violation_detection(self):
-        """Test early N-violation detection in single-process systems."""
-        monitor = PBTLMonitor("EP(EP(late_prop) & !EP(early_prop))")
-        monitor.initialize_from_trace_processes(["P"])
-
-        events = [
-            create_event("early_event", {"P"}, {"P": 1}, {"early_prop"}),
-            create_event("late_event", {"P"}, {"P": 2}, {"late_prop"}),
-        ]
-
-        # Process early event first
-        monitor.process_event(events[0])
-        # Should not fail immediately in multi-case scenarios
-
-        monitor.process_event(events[1])
-        # Should fail because early_prop ≤ late_prop in single process
-        assert monitor.global_verdict == Verdict.FALSE
-
     def test_very_large_vector_clocks(self):
         """Test monitor with very large vector clock values."""
         monitor = PBTLMonitor("EP(target)")
@@ -668,10 +566,9 @@ class TestEdgeCasesAndCornerCases:
 
         assert monitor.global_verdict == Verdict.UNKNOWN
 
-    def test_zero_timestamp_handling(self):
+    def test_zero_timestamp_handling(self, monitor_factory):
         """Test proper handling of zero timestamps in vector clocks."""
-        monitor = PBTLMonitor("EP(EP(init) & !EP(error))")
-        monitor.initialize_from_trace_processes(["P", "Q"])
+        monitor = monitor_factory("EP(EP(init) & !EP(error))", ["P", "Q"])
 
         events = [
             create_event(
@@ -760,39 +657,21 @@ class TestEdgeCasesAndCornerCases:
         monitor = PBTLMonitor("EP(EP(request) & EP(response) & EP(confirmation))")
         monitor.initialize_from_trace_processes(["Client", "Server", "DB"])
 
-        # Complex communication pattern
-        events = [
-            create_event(
-                "client_request",
-                {"Client"},
-                {"Client": 1, "Server": 0, "DB": 0},
-                {"request"},
-            ),
-            create_event(
-                "server_db_query",
-                {"Server", "DB"},
-                {"Client": 1, "Server": 1, "DB": 1},
-                {"query"},
-            ),
-            create_event(
-                "db_response",
-                {"DB"},
-                {"Client": 1, "Server": 1, "DB": 2},
-                {"db_result"},
-            ),
-            create_event(
-                "server_response",
-                {"Server"},
-                {"Client": 1, "Server": 2, "DB": 2},
-                {"response"},
-            ),
-            create_event(
-                "client_confirm",
-                {"Client"},
-                {"Client": 2, "Server": 2, "DB": 2},
-                {"confirmation"},
-            ),
+        # Complex communication pattern; each event's clock is given as the
+        # entries that changed since the previous event
+        steps = [
+            ("client_request", {"Client"}, {"Client": 1}, {"request"}),
+            ("server_db_query", {"Server", "DB"}, {"Server": 1, "DB": 1}, {"query"}),
+            ("db_response", {"DB"}, {"DB": 2}, {"db_result"}),
+            ("server_response", {"Server"}, {"Server": 2}, {"response"}),
+            ("client_confirm", {"Client"}, {"Client": 2}, {"confirmation"}),
         ]
+        clock = VectorClock({"Client": 0, "Server": 0, "DB": 0})
+        events = []
+        for eid, procs, delta, props in steps:
+            clock = VectorClock.from_delta(clock, delta)
+            events.append(create_event(eid, procs, clock, props))
+        assert events[-1].vc == VectorClock({"Client": 2, "Server": 2, "DB": 2})
 
         for event in events:
             monitor.process_event(event)
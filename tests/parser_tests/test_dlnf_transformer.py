@@ -12,7 +12,8 @@ Tests verify correctness, structural properties, and idempotence of transformati
 
 import re
 import pytest
-from parser import parse, parse_and_dlnf
+from parser import parse, parse_and_dlnf, parse_dlnf_disjuncts
+from parser.ast_nodes import Or
 from utils.logger import get_logger
 
 # Pattern to detect OR operators within EP expressions (invalid in DLNF)
@@ -61,6 +62,21 @@ class TestDLNFTransformation:
         ("EP(!(p & (q | EP(r | s))))", "(EP(!p) | EP(((!q & !EP(r)) & !EP(s))))"),
     ]
 
+    @pytest.mark.parametrize("input_formula", [case[0] for case in TEST_CASES])
+    def test_disjuncts_rebuild_dlnf(self, input_formula):
+        """Test that the returned disjuncts are the terms of the DLNF Or chain.
+
+        Args:
+            input_formula: Original PBTL formula string
+        """
+        disjuncts = parse_dlnf_disjuncts(input_formula)
+
+        rebuilt = disjuncts[0]
+        for term in disjuncts[1:]:
+            rebuilt = Or(rebuilt, term)
+        assert rebuilt == parse_and_dlnf(input_formula)
+        assert not any(isinstance(term, Or) for term in disjuncts)
+
     @pytest.mark.parametrize("input_formula, expected_output", TEST_CASES)
     def test_dlnf_transformation_correctness(self, input_formula, expected_output):
         """Test DLNF transformation produces correct output structure.
@@ -53,6 +53,19 @@ class PBTLLogger:
         for handler in self.logger.handlers:
             handler.setLevel(level.value)
 
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Check whether messages at a level would be emitted.
+
+        Lets callers skip building expensive log messages that would be dropped.
+
+        Args:
+            level: Logging level to check
+
+        Returns:
+            True if messages at this level are currently logged
+        """
+        return self.logger.isEnabledFor(level.value)
+
     # Core logging methods
     def debug(self, message: str, **kwargs):
         """Log debug message (detailed internal state)."""
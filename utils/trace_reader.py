@@ -4,6 +4,7 @@
 # CSV trace file reader for distributed system event sequences
 
 import csv
+from functools import lru_cache
 from pathlib import Path
 from typing import List, FrozenSet, Iterator
 from core.event import Event, VectorClock
@@ -151,9 +152,14 @@ def _parse_event_row(row: dict) -> Event:
     )
 
 
+@lru_cache(maxsize=1024)
 def _parse_processes(processes_str: str) -> FrozenSet[str]:
     """Parse pipe-separated process list.
 
+    Memoized like ``_parse_props``: every event of a process, and every joint
+    event over the same processes, shares one interned frozenset whose hash
+    is computed once.
+
     Args:
         processes_str: String like 'PA|PB|PC'
 
@@ -205,9 +211,14 @@ def _parse_vector_clock(vc_str: str) -> VectorClock:
     return VectorClock(clock)
 
 
+@lru_cache(maxsize=1024)
 def _parse_props(props_str: str) -> FrozenSet[str]:
     """Parse pipe-separated proposition list.
 
+    Traces repeat a small number of distinct proposition fields, so results
+    are memoized per field: events with the same propositions share a single
+    frozenset instead of each allocating its own.
+
     Args:
         props_str: String like 'p|q|r'
 